@@ -3,11 +3,24 @@
 Usage:
     python -m src.MCP_Servers.crime_mcp
 """
-from .server import run_server, logger
+import asyncio
+
+from .server import configure_logging, run_server, logger
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
 
 
 def main():
     """Main entry point to start the Crime MCP server."""
+    configure_logging()
+
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+
     try:
         logger.info("Starting Crime MCP Server...")
         print("--- Crime MCP Server --- (Press Ctrl+C to exit)")
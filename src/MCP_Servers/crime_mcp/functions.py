@@ -7,11 +7,14 @@ Endpoints used:
     GET /v1/incidents/stats      - Crime statistics (totals + breakdown by type)
     GET /v1/incidents/raw-data   - Individual crime incident records
 """
+import asyncio
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional
 
 import httpx
+import orjson
 
 logger = logging.getLogger("crime-mcp")
 
@@ -37,6 +40,113 @@ def get_date_range(days_back: int = 180) -> tuple[str, str]:
     return start.strftime(fmt), now.strftime(fmt)
 
 
+# =============================================================================
+# RESPONSE CACHE
+# =============================================================================
+
+# Nearby waypoints (dense urban sampling) and repeated route queries hit the
+# same area over and over, so successful responses are cached in-process.
+CACHE_TTL_SECONDS = 3600
+CACHE_MAX_ENTRIES = 4096
+
+# Points are snapped to a grid whose cells span at most half the search
+# radius, so a point answered from another point's query is never more than
+# ~0.7 radii from the circle actually searched
+CACHE_CELL_RADIUS_FRACTION = 0.5
+MILES_PER_DEGREE_LATITUDE = 69.0
+
+# Longest Retry-After we are willing to wait before retrying a 429 once
+MAX_RETRY_AFTER_SECONDS = 10.0
+
+# Bodies larger than this (multi-page raw-data dumps) are parsed in a worker
+# thread so the event loop keeps serving other waypoint requests meanwhile
+LARGE_BODY_BYTES = 1_000_000
+
+# cache key -> (expires_at, parsed JSON body)
+_response_cache: Dict[tuple, tuple[float, Any]] = {}
+
+
+def grid_cell(latitude: float, longitude: float, radius_miles: float) -> tuple:
+    """
+    Snap a point to a grid cell sized from the search radius.
+
+    A degree of longitude is never wider than a degree of latitude, so
+    sizing both axes in latitude degrees keeps cells within the bound.
+
+    Returns:
+        (lat index, lon index, radius_miles) - equal for points that may
+        share one query
+    """
+    cell_degrees = radius_miles * CACHE_CELL_RADIUS_FRACTION / MILES_PER_DEGREE_LATITUDE
+    return (
+        round(latitude / cell_degrees),
+        round(longitude / cell_degrees),
+        radius_miles,
+    )
+
+
+def _cache_key(
+    endpoint: str,
+    latitude: float,
+    longitude: float,
+    radius_miles: float,
+    days_back: int,
+    page: Optional[int] = None,
+) -> tuple:
+    """Build a cache key with coordinates snapped to the radius-sized grid."""
+    return (endpoint, *grid_cell(latitude, longitude, radius_miles), days_back, page)
+
+
+async def _fetch(
+    client: httpx.AsyncClient,
+    url: str,
+    params: Dict[str, Any],
+    cache_key: tuple,
+) -> Any:
+    """
+    GET a Crimeometer endpoint and return the parsed JSON body.
+
+    Serves repeat queries from the TTL cache; only successful responses are
+    cached. A 429 is retried once on the same pooled connection after
+    honouring Retry-After (capped at MAX_RETRY_AFTER_SECONDS).
+
+    Raises:
+        httpx.HTTPStatusError: On non-2xx responses (including 429)
+    """
+    now = time.monotonic()
+    cached = _response_cache.get(cache_key)
+    if cached is not None and cached[0] > now:
+        logger.info(f"Cache hit: {cache_key}")
+        return cached[1]
+
+    response = await client.get(url, params=params)
+    if response.status_code == 429:
+        try:
+            retry_after = float(response.headers.get("Retry-After", 1))
+        except ValueError:
+            retry_after = 1.0
+        retry_after = min(max(retry_after, 0.0), MAX_RETRY_AFTER_SECONDS)
+        logger.warning(f"Rate limited, retrying once in {retry_after:.1f}s")
+        await asyncio.sleep(retry_after)
+        response = await client.get(url, params=params)
+    response.raise_for_status()
+    body = response.content
+    if len(body) > LARGE_BODY_BYTES:
+        data = await asyncio.to_thread(orjson.loads, body)
+    else:
+        data = orjson.loads(body)
+
+    if len(_response_cache) >= CACHE_MAX_ENTRIES:
+        for key in [k for k, (expires, _) in _response_cache.items() if expires <= now]:
+            del _response_cache[key]
+        if len(_response_cache) >= CACHE_MAX_ENTRIES:
+            # Still full: evict the oldest entry (dicts keep insertion order)
+            del _response_cache[next(iter(_response_cache))]
+
+    _response_cache[cache_key] = (now + CACHE_TTL_SECONDS, data)
+    return data
+
+
 # =============================================================================
 # CRIMEOMETER API CALLS
 # =============================================================================
@@ -46,9 +156,9 @@ async def get_crime_stats(
     longitude: float,
     radius_miles: float,
     days_back: int,
-    api_key: str,
     base_url: str,
     client: httpx.AsyncClient,
+    datetime_window: Optional[tuple[str, str]] = None,
 ) -> Dict[str, Any]:
     """
     Get crime statistics for a location from Crimeometer.
@@ -60,14 +170,15 @@ async def get_crime_stats(
         longitude: GPS longitude
         radius_miles: Search radius in miles
         days_back: Number of days to look back
-        api_key: Crimeometer API key
         base_url: Crimeometer base URL
-        client: Shared httpx async client
+        client: Shared httpx async client (carries the API key headers)
+        datetime_window: Precomputed (datetime_ini, datetime_end); computed
+            from days_back when not given
 
     Returns:
         Dict with total_incidents, report_types, and query metadata.
     """
-    datetime_ini, datetime_end = get_date_range(days_back)
+    datetime_ini, datetime_end = datetime_window or get_date_range(days_back)
 
     url = f"{base_url}/incidents/stats"
     params = {
@@ -77,47 +188,44 @@ async def get_crime_stats(
         "datetime_ini": datetime_ini,
         "datetime_end": datetime_end,
     }
-    headers = {
-        "Content-Type": "application/json",
-        "x-api-key": api_key,
-    }
 
     logger.info(f"Calling stats: ({latitude}, {longitude}) radius={radius_miles}mi")
 
     try:
-        response = await client.get(url, params=params, headers=headers)
-
-        if response.status_code == 429:
-            return {
-                "error": "Rate limit exceeded",
-                "status_code": 429,
-                "location": {"lat": latitude, "lon": longitude},
-            }
-
-        response.raise_for_status()
-        data = response.json()
+        data = await _fetch(
+            client,
+            url,
+            params,
+            _cache_key("stats", latitude, longitude, radius_miles, days_back),
+        )
 
         # Crimeometer returns a list with one element
-        if isinstance(data, list) and len(data) > 0:
-            result = data[0]
+        result = data[0] if isinstance(data, list) and data else None
+        if result is None:
             return {
-                "total_incidents": result.get("total_incidents", 0),
-                "report_types": result.get("report_types", []),
+                "total_incidents": 0,
+                "report_types": [],
                 "location": {"lat": latitude, "lon": longitude},
-                "query": {
-                    "radius_miles": radius_miles,
-                    "datetime_ini": datetime_ini,
-                    "datetime_end": datetime_end,
-                },
             }
 
         return {
-            "total_incidents": 0,
-            "report_types": [],
+            "total_incidents": result.get("total_incidents", 0),
+            "report_types": result.get("report_types", []),
             "location": {"lat": latitude, "lon": longitude},
+            "query": {
+                "radius_miles": radius_miles,
+                "datetime_ini": datetime_ini,
+                "datetime_end": datetime_end,
+            },
         }
 
     except httpx.HTTPStatusError as e:
+        if e.response.status_code == 429:
+            return {
+                "error": "Rate limit exceeded",
+                "status_code": 429,
+                "location": {"lat": latitude, "lon": longitude},
+            }
         logger.error(f"Stats API HTTP error: {e.response.status_code}")
         return {
             "error": f"HTTP {e.response.status_code}: {e.response.text[:200]}",
@@ -137,10 +245,11 @@ async def get_crime_incidents(
     longitude: float,
     radius_miles: float,
     days_back: int,
-    api_key: str,
     base_url: str,
     client: httpx.AsyncClient,
     page: int = 1,
+    limit: Optional[int] = None,
+    datetime_window: Optional[tuple[str, str]] = None,
 ) -> Dict[str, Any]:
     """
     Get raw crime incident data for a location from Crimeometer.
@@ -152,15 +261,17 @@ async def get_crime_incidents(
         longitude: GPS longitude
         radius_miles: Search radius in miles
         days_back: Number of days to look back
-        api_key: Crimeometer API key
         base_url: Crimeometer base URL
-        client: Shared httpx async client
+        client: Shared httpx async client (carries the API key headers)
         page: Page number for pagination (default 1)
+        limit: Maximum incidents to return (default: all on the page)
+        datetime_window: Precomputed (datetime_ini, datetime_end); computed
+            from days_back when not given
 
     Returns:
         Dict with incidents list, total count, and query metadata.
     """
-    datetime_ini, datetime_end = get_date_range(days_back)
+    datetime_ini, datetime_end = datetime_window or get_date_range(days_back)
 
     url = f"{base_url}/incidents/raw-data"
     params = {
@@ -171,54 +282,51 @@ async def get_crime_incidents(
         "datetime_end": datetime_end,
         "page": page,
     }
-    headers = {
-        "Content-Type": "application/json",
-        "x-api-key": api_key,
-    }
 
     logger.info(f"Calling raw-data: ({latitude}, {longitude}) radius={radius_miles}mi page={page}")
 
     try:
-        response = await client.get(url, params=params, headers=headers)
-
-        if response.status_code == 429:
-            return {
-                "error": "Rate limit exceeded",
-                "status_code": 429,
-                "incidents": [],
-                "total_incidents": 0,
-                "location": {"lat": latitude, "lon": longitude},
-            }
-
-        response.raise_for_status()
-        data = response.json()
+        data = await _fetch(
+            client,
+            url,
+            params,
+            _cache_key("raw-data", latitude, longitude, radius_miles, days_back, page),
+        )
 
         # Crimeometer returns a list with one element containing incidents
-        if isinstance(data, list) and len(data) > 0:
-            result = data[0]
-            incidents = result.get("incidents", [])
+        result = data[0] if isinstance(data, list) and data else None
+        if result is None:
             return {
-                "total_incidents": result.get("total_incidents", 0),
-                "total_pages": result.get("total_pages", 1),
-                "incidents": incidents,
-                "incidents_returned": len(incidents),
+                "total_incidents": 0,
+                "incidents": [],
+                "incidents_returned": 0,
                 "location": {"lat": latitude, "lon": longitude},
-                "query": {
-                    "radius_miles": radius_miles,
-                    "datetime_ini": datetime_ini,
-                    "datetime_end": datetime_end,
-                    "page": page,
-                },
             }
 
+        incidents = result.get("incidents", [])[:limit]
         return {
-            "total_incidents": 0,
-            "incidents": [],
-            "incidents_returned": 0,
+            "total_incidents": result.get("total_incidents", 0),
+            "total_pages": result.get("total_pages", 1),
+            "incidents": incidents,
+            "incidents_returned": len(incidents),
             "location": {"lat": latitude, "lon": longitude},
+            "query": {
+                "radius_miles": radius_miles,
+                "datetime_ini": datetime_ini,
+                "datetime_end": datetime_end,
+                "page": page,
+            },
         }
 
     except httpx.HTTPStatusError as e:
+        if e.response.status_code == 429:
+            return {
+                "error": "Rate limit exceeded",
+                "status_code": 429,
+                "incidents": [],
+                "total_incidents": 0,
+                "location": {"lat": latitude, "lon": longitude},
+            }
         logger.error(f"Raw-data API HTTP error: {e.response.status_code}")
         return {
             "error": f"HTTP {e.response.status_code}: {e.response.text[:200]}",
@@ -6,6 +6,7 @@ Uses the Crimeometer API for crime statistics and incident data.
 Running the Server:
     python -m src.MCP_Servers.crime_mcp
 """
+import asyncio
 import logging
 import sys
 from typing import Optional
@@ -13,25 +14,48 @@ from contextlib import asynccontextmanager
 
 import httpx
 from fastmcp import FastMCP
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from .config import CrimeMCPSettings
-from .functions import get_crime_stats, get_crime_incidents
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-    force=True,
+from .functions import (
+    get_crime_stats,
+    get_crime_incidents,
+    get_date_range,
+    grid_cell,
 )
+
 logger = logging.getLogger("crime-mcp")
 
+
+def configure_logging() -> None:
+    """Send INFO logs to stdout; called by the entry points, not on import."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+        force=True,
+    )
+
 # Global HTTP client - reused across requests
 http_client: Optional[httpx.AsyncClient] = None
 
 # Load settings from .env
 settings = CrimeMCPSettings()
 
+# Worker tasks draining a batched route query; bounds in-flight Crimeometer
+# requests so long routes don't trigger a burst of 429s
+ROUTE_QUERY_WORKERS = 20
+
+
+class RoutePoint(BaseModel):
+    """A waypoint to query in get_route_crime_stats."""
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
+    radius_miles: Optional[float] = Field(default=None, gt=0)  # Tool default if unset
+
+
+_route_points = TypeAdapter(list[RoutePoint])
+
 
 @asynccontextmanager
 async def lifespan(mcp: FastMCP):
@@ -39,7 +63,21 @@ async def lifespan(mcp: FastMCP):
     global http_client
 
     logger.info("Crime MCP server starting...")
-    http_client = httpx.AsyncClient(timeout=30.0)
+    # One pooled HTTP/2 client for the server lifetime so concurrent waypoint
+    # queries share keep-alive connections instead of re-handshaking TLS.
+    # The transport retries failed connection attempts (not HTTP errors).
+    http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(connect=5.0, read=25.0, write=5.0, pool=5.0),
+        transport=httpx.AsyncHTTPTransport(
+            retries=3,
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+            http2=True,
+        ),
+        headers={
+            "Content-Type": "application/json",
+            "x-api-key": settings.CRIME_API_KEY,
+        },
+    )
     logger.info("HTTP client initialized")
 
     yield
@@ -101,7 +139,6 @@ async def get_location_crime_stats(
             longitude=longitude,
             radius_miles=radius_miles,
             days_back=days_back,
-            api_key=settings.CRIME_API_KEY,
             base_url=settings.CRIME_API_BASE_URL,
             client=http_client,
         )
@@ -152,20 +189,106 @@ async def get_location_crime_incidents(
             longitude=longitude,
             radius_miles=radius_miles,
             days_back=days_back,
-            api_key=settings.CRIME_API_KEY,
             base_url=settings.CRIME_API_BASE_URL,
             client=http_client,
+            limit=limit,
         )
-        # Apply limit
-        if "incidents" in result and len(result["incidents"]) > limit:
-            result["incidents"] = result["incidents"][:limit]
-            result["incidents_returned"] = limit
         return result
     except Exception as e:
         logger.error(f"Crime incidents error: {e}")
         return {"error": str(e)}
 
 
+@mcp.tool(
+    description=(
+        "Get crime statistics for many points along a route in one call. "
+        "Each point is a dict with 'latitude' and 'longitude' (and optionally "
+        "'radius_miles'). Results are returned in the same order as the points. "
+        "Prefer this over calling get_location_crime_stats once per waypoint."
+    )
+)
+async def get_route_crime_stats(
+    points: list[RoutePoint],
+    radius_miles: float = 0.25,
+    days_back: int = 14,
+) -> dict:
+    """
+    Query crime statistics for every waypoint of a route concurrently.
+
+    Args:
+        points: Waypoints as RoutePoint models (or equivalent dicts)
+        radius_miles: Default search radius in miles for each point
+        days_back: Number of days to look back
+
+    Returns:
+        Dictionary containing:
+        - results: Per-point stats (same shape as get_location_crime_stats),
+          aligned with the input order
+        - points_queried: Number of points queried
+        - unique_queries: Crimeometer calls issued after grid deduplication
+    """
+    # MCP calls are validated by FastMCP already; this covers direct callers
+    # passing plain dicts, before anything is fanned out
+    try:
+        points = _route_points.validate_python(points)
+    except ValidationError as e:
+        logger.error(f"Invalid route points: {e}")
+        return {"error": f"Invalid points: {e}"}
+
+    if not http_client:
+        logger.error("HTTP client not initialized")
+        return {"error": "Server not properly initialized"}
+
+    # Same date window for every point in the batch
+    datetime_window = get_date_range(days_back)
+
+    # Adjacent urban waypoints fall in the same grid cell (sized from the
+    # search radius), so query each cell once (at its first point) and fan
+    # the answer back out to the rest
+    cells: dict[tuple, list[int]] = {}
+    for i, point in enumerate(points):
+        key = grid_cell(point.latitude, point.longitude, point.radius_miles or radius_miles)
+        cells.setdefault(key, []).append(i)
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for indices in cells.values():
+        queue.put_nowait(indices)
+    results: list = [None] * len(points)
+
+    async def worker() -> None:
+        while not queue.empty():
+            indices = queue.get_nowait()
+            point = points[indices[0]]
+            try:
+                stats = await get_crime_stats(
+                    latitude=point.latitude,
+                    longitude=point.longitude,
+                    radius_miles=point.radius_miles or radius_miles,
+                    days_back=days_back,
+                    base_url=settings.CRIME_API_BASE_URL,
+                    client=http_client,
+                    datetime_window=datetime_window,
+                )
+            except Exception as e:
+                logger.error(f"Route crime stats error at point {indices[0]}: {e}")
+                stats = {"error": str(e)}
+            for i in indices:
+                results[i] = {
+                    **stats,
+                    "location": {"lat": points[i].latitude, "lon": points[i].longitude},
+                }
+
+    await asyncio.gather(
+        *(worker() for _ in range(min(ROUTE_QUERY_WORKERS, len(cells))))
+    )
+
+    return {
+        "results": results,
+        "points_queried": len(points),
+        "unique_queries": len(cells),
+    }
+
+
 def run_server():
     """Start the MCP server on port 8001."""
     logger.info("Starting Crime MCP server on port 8001...")
@@ -179,4 +302,5 @@ def run_server():
 
 
 if __name__ == "__main__":
+    configure_logging()
     run_server()
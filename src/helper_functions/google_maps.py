@@ -13,28 +13,124 @@ Usage:
         start="Willis Tower, Chicago, IL",
         destination="Navy Pier, Chicago, IL"
     )
+
+    # From async code (FastAPI, agents), await the async variant instead
+    routes = await use_google_maps_async(start, destination)
+
+    # Or handle each route as soon as it is ready
+    async for route in use_google_maps_stream(start, destination):
+        ...
 """
+import asyncio
+import hashlib
+import json
 import os
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field, asdict
+import threading
+import time
+import warnings
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from typing import Any, AsyncIterator, Coroutine, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 import googlemaps
-import polyline as polyline_lib
+import httpx
+import numpy as np
+import orjson
 from math import radians, sin, cos, sqrt, atan2
 
 from dotenv import load_dotenv
 
+# Optional Rust polyline decoder (pip install pypolyline); falls back to the
+# NumPy decoder below
+try:
+    from pypolyline.cutil import decode_polyline as _native_decode_polyline
+except ImportError:
+    _native_decode_polyline = None
+
 # Load environment variables
 load_dotenv()
 
 # Initialize Google Maps API key
 GOOGLE_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
 
+EARTH_RADIUS_MILES = 3959
+POLYLINE_DECIMALS = 5  # Google encodes coordinates with 5 decimals
+POLYLINE_PRECISION = 10 ** POLYLINE_DECIMALS
+
+# Route distance thresholds (miles) and the sampling interval for each band:
+# < 5 urban, < 10 short urban, < 20 suburban, < 40 mixed, otherwise highway
+ADAPTIVE_THRESHOLDS = (5, 10, 20, 40)
+ADAPTIVE_INTERVALS = (0.5, 0.75, 1.5, 2.5, 4.0)
+
+DIRECTIONS_URL = "https://maps.googleapis.com/maps/api/directions/json"
+# Set USE_GMAPS_SDK=1 to route Directions through the googlemaps SDK instead
+USE_GMAPS_SDK = os.getenv("USE_GMAPS_SDK") == "1"
+
+# Leg fields read from a Directions response (everything else is dropped)
+DIRECTIONS_LEG_FIELDS = (
+    "distance", "duration", "duration_in_traffic", "start_address", "end_address"
+)
+
+# Connection settings for every httpx client talking to maps.googleapis.com;
+# HTTP/2 multiplexes the concurrent fan-outs over a few connections
+GOOGLE_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+PLACES_NEARBY_URL = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
+MAX_CONCURRENT_PLACES_REQUESTS = 10
+
+# Places searches are cached per ~110 m cell (coordinates rounded to 3
+# decimals) - negligible next to the 1 mile search radius, and route
+# alternatives usually share their start, end and downtown stretches
+PLACES_CACHE_DECIMALS = 3
+PLACES_CACHE_MAX_ENTRIES = 2048
+
+# (lat, lon, type, radius, max) rounded -> places, least recently used first
+_places_cache: "OrderedDict[tuple, List[PlaceInfo]]" = OrderedDict()
+
+# Guards the in-process caches (the sync helpers run their event loops in
+# worker threads, so several calls may touch them at once)
+_cache_lock = threading.Lock()
+
+GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+MAX_CONCURRENT_GEOCODE_REQUESTS = 16
+
+# Address component types used as waypoint descriptions, most specific first
+GEOCODE_TYPE_PRIORITY = ("neighborhood", "sublocality", "locality")
+URBAN_COMPONENT_TYPES = frozenset({"neighborhood", "sublocality"})
+
+# Distance Matrix bills per origin x destination element and allows 25
+# destinations per request; pairs are ranked one origin per request, so
+# every pair costs exactly one element
+DISTANCE_MATRIX_MAX_DESTINATIONS = 25
+
+# Opt-in on-disk Directions cache: set SAFETRAVELS_CACHE_DIR to a directory
+# and repeated runs of the same trip skip the API for up to an hour.
+# Requests with include_traffic are never cached (traffic must be live).
+DIRECTIONS_CACHE_DIR = os.getenv("SAFETRAVELS_CACHE_DIR", "")
+DIRECTIONS_CACHE_TTL_SECONDS = 3600
+
+# Client-side request rate per Google API (requests per second); keeps
+# concurrent fan-out under Google's QPS caps instead of drawing 429s
+DEFAULT_API_QPS = 50
+
+# Reverse geocode results are cached per ~11 m cell (coordinates rounded to
+# 4 decimals); route alternatives share most of their neighborhoods
+GEOCODE_CACHE_DECIMALS = 4
+GEOCODE_CACHE_MAX_ENTRIES = 4096
+
+# (lat, lon) rounded -> (description, area_type), least recently used first
+_geocode_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RoutePoint:
     """A point along a route for crime analysis."""
     latitude: float
@@ -43,7 +139,7 @@ class RoutePoint:
     area_type: Optional[str] = None    # "urban", "suburban", "rural"
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceInfo:
     """A place of interest along the route."""
     name: str
@@ -53,7 +149,7 @@ class PlaceInfo:
     vicinity: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TrafficInfo:
     """Traffic information for a route."""
     duration_in_traffic_minutes: int
@@ -61,7 +157,7 @@ class TrafficInfo:
     traffic_condition: str      # "light", "moderate", "heavy"
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteData:
     """Complete route data for crime analysis."""
     route_id: int
@@ -94,11 +190,139 @@ class RouteData:
                 for wp in self.waypoints
             ],
             "polyline": self.polyline,
-            "traffic": asdict(self.traffic) if self.traffic else None,
-            "places_along_route": [asdict(p) for p in self.places_along_route]
+            "traffic": {
+                "duration_in_traffic_minutes": self.traffic.duration_in_traffic_minutes,
+                "traffic_delay_minutes": self.traffic.traffic_delay_minutes,
+                "traffic_condition": self.traffic.traffic_condition
+            } if self.traffic else None,
+            "places_along_route": [
+                {
+                    "name": p.name,
+                    "place_type": p.place_type,
+                    "latitude": p.latitude,
+                    "longitude": p.longitude,
+                    "vicinity": p.vicinity
+                }
+                for p in self.places_along_route
+            ]
         }
 
 
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def _client() -> googlemaps.Client:
+    """Shared Google Maps client, so its requests.Session keeps connections alive."""
+    return googlemaps.Client(key=GOOGLE_API_KEY, timeout=30)
+
+
+@lru_cache(maxsize=1)
+def _http_client() -> httpx.Client:
+    """Shared sync httpx client for direct (non-SDK) Google REST calls."""
+    return httpx.Client(timeout=30.0, http2=True, limits=GOOGLE_HTTP_LIMITS)
+
+
+def _run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine to completion from a sync helper.
+
+    Uses asyncio.run() normally. When called from code that already has an
+    event loop running, asyncio.run() would fail, so the coroutine runs on
+    its own loop in a worker thread instead; the caller blocks just like the
+    sync API always has (async callers should await the *_async variants).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+class _RateLimiter:
+    """
+    Token bucket allowing `rate` requests per second (bursts up to `rate`,
+    and at least one, so rates below 1/s still let a call through).
+
+    Usable as `async with` (event-loop fan-outs) or plain `with` (blocking
+    calls, which run in worker threads). Holds no event-loop state and
+    guards the bucket with a lock, so one module-level instance can be
+    shared across threads and the separate loops of the sync helpers.
+    """
+    __slots__ = ("rate", "capacity", "tokens", "updated", "lock")
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _take(self) -> float:
+        """Take a token if one is available; otherwise return seconds to wait."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    async def __aenter__(self) -> None:
+        while True:
+            delay = self._take()
+            if not delay:
+                return
+            await asyncio.sleep(delay)
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def __enter__(self) -> None:
+        while True:
+            delay = self._take()
+            if not delay:
+                return
+            time.sleep(delay)
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_rate_limiters: Dict[str, _RateLimiter] = {
+    "directions": _RateLimiter(DEFAULT_API_QPS),
+    "distance_matrix": _RateLimiter(DEFAULT_API_QPS),
+    "places": _RateLimiter(DEFAULT_API_QPS),
+    "geocoding": _RateLimiter(DEFAULT_API_QPS),
+}
+
+
+def set_rate(api: str, qps: float) -> None:
+    """
+    Change the client-side request rate for one Google API.
+
+    Args:
+        api: "directions", "distance_matrix", "places" or "geocoding"
+        qps: Maximum requests per second
+
+    Raises:
+        ValueError: If the API name or rate is invalid
+    """
+    if api not in _rate_limiters:
+        raise ValueError(f"Unknown API '{api}', expected one of {sorted(_rate_limiters)}")
+    if qps <= 0:
+        raise ValueError("qps must be positive")
+    _rate_limiters[api] = _RateLimiter(qps)
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -114,7 +338,7 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         Distance in miles
     """
-    R = 3959  # Earth's radius in miles
+    R = EARTH_RADIUS_MILES
 
     lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
     dlat = lat2 - lat1
@@ -143,16 +367,99 @@ def get_adaptive_interval(total_distance_miles: float) -> float:
     Returns:
         Sampling interval in miles
     """
-    if total_distance_miles < 5:
-        return 0.5   # Very dense for short urban routes
-    elif total_distance_miles < 10:
-        return 0.75  # Dense for urban routes
-    elif total_distance_miles < 20:
-        return 1.5   # Moderate for suburban
-    elif total_distance_miles < 40:
-        return 2.5   # Mixed urban/highway
-    else:
-        return 4.0   # Sparse for long highway routes
+    return ADAPTIVE_INTERVALS[bisect_right(ADAPTIVE_THRESHOLDS, total_distance_miles)]
+
+
+def decode_polyline(encoded_polyline: str) -> np.ndarray:
+    """
+    Decode a Google encoded polyline into a coordinate array.
+
+    Uses pypolyline's native decoder when it is installed. Otherwise only
+    the varint decode runs in Python; the per-vertex delta accumulation and
+    scaling are done by NumPy in one pass.
+
+    Args:
+        encoded_polyline: Google's encoded polyline string
+
+    Returns:
+        Array of shape (N, 2) with latitude in column 0, longitude in column 1
+    """
+    if _native_decode_polyline is not None:
+        try:
+            # pypolyline returns GeoJSON order [lon, lat]
+            coords = _native_decode_polyline(encoded_polyline.encode(), POLYLINE_DECIMALS)
+        except RuntimeError:
+            # Rejects out-of-range coordinates; let the Python decoder handle it
+            pass
+        else:
+            flat = np.fromiter(chain.from_iterable(coords), np.float64, count=2 * len(coords))
+            return flat.reshape(-1, 2)[:, ::-1]
+
+    return _decode_polyline_numpy(encoded_polyline)
+
+
+def _decode_polyline_numpy(encoded_polyline: str) -> np.ndarray:
+    """Pure Python/NumPy decoder behind decode_polyline (same return shape)."""
+    deltas = []
+    result = shift = 0
+
+    for char in encoded_polyline.encode():
+        chunk = char - 63
+        result |= (chunk & 0x1F) << shift
+        shift += 5
+        if chunk < 0x20:
+            deltas.append(~(result >> 1) if result & 1 else result >> 1)
+            result = shift = 0
+
+    coords = np.array(deltas, dtype=np.int64).reshape(-1, 2)
+    return np.cumsum(coords, axis=0) / POLYLINE_PRECISION
+
+
+def _sample_indices(coords: np.ndarray, interval_miles: float) -> List[int]:
+    """
+    Pick the indices of the vertices to keep as waypoints.
+
+    Works on the (N, 2) coordinate array directly so no per-vertex Python
+    objects are created; only the returned indices become RoutePoints.
+
+    Args:
+        coords: Decoded polyline, shape (N, 2) as (lat, lon) degrees
+        interval_miles: Distance between sample points
+
+    Returns:
+        Sorted vertex indices, always starting with 0
+    """
+    # Haversine for every segment at once, then cumulative distance per vertex
+    lat = np.radians(coords[:, 0])
+    lon = np.radians(coords[:, 1])
+    a = (
+        np.sin(np.diff(lat) / 2) ** 2
+        + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lon) / 2) ** 2
+    )
+    segment_distances = 2 * EARTH_RADIUS_MILES * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    cumulative = np.concatenate(([0.0], np.cumsum(segment_distances)))
+
+    # Always include start point, then jump to the first vertex at least
+    # interval_miles past the previous sample
+    indices = [0]
+    while True:
+        next_index = int(np.searchsorted(
+            cumulative, cumulative[indices[-1]] + interval_miles, side="left"
+        ))
+        next_index = max(next_index, indices[-1] + 1)
+        if next_index >= len(coords):
+            break
+        indices.append(next_index)
+
+    # Always include end point if it's more than 0.1 miles from the last sample
+    last_index = len(coords) - 1
+    if indices[-1] != last_index:
+        last_lat, last_lon = coords[indices[-1]].tolist()
+        final_lat, final_lon = coords[last_index].tolist()
+        if haversine_distance(last_lat, last_lon, final_lat, final_lon) > 0.1:
+            indices.append(last_index)
+
+    return indices
 
 
 def sample_points_from_polyline(
@@ -172,50 +479,25 @@ def sample_points_from_polyline(
     Returns:
         List of RoutePoint objects evenly distributed along the route
     """
-    # Decode the polyline to get all coordinate points
-    coords = polyline_lib.decode(encoded_polyline)
+    coords = decode_polyline(encoded_polyline)
 
-    if not coords:
+    if len(coords) == 0:
         return []
 
-    # Always include start point
-    waypoints = [RoutePoint(latitude=coords[0][0], longitude=coords[0][1])]
-    accumulated_distance = 0.0
-
-    for i in range(1, len(coords)):
-        prev_lat, prev_lon = coords[i-1]
-        curr_lat, curr_lon = coords[i]
-
-        segment_distance = haversine_distance(prev_lat, prev_lon, curr_lat, curr_lon)
-        accumulated_distance += segment_distance
-
-        # Add point if we've traveled far enough
-        if accumulated_distance >= interval_miles:
-            waypoints.append(RoutePoint(latitude=curr_lat, longitude=curr_lon))
-            accumulated_distance = 0.0
-
-    # Always include end point (if not already added)
-    if len(coords) > 1:
-        final_lat, final_lon = coords[-1]
-        last_wp = waypoints[-1]
-
-        # Check if end point is different from last waypoint
-        distance_to_end = haversine_distance(
-            last_wp.latitude, last_wp.longitude,
-            final_lat, final_lon
-        )
-
-        # Add end point if it's more than 0.1 miles from last waypoint
-        if distance_to_end > 0.1:
-            waypoints.append(RoutePoint(latitude=final_lat, longitude=final_lon))
-
-    return waypoints
+    return [
+        RoutePoint(latitude=lat, longitude=lon)
+        for lat, lon in coords[_sample_indices(coords, interval_miles)].tolist()
+    ]
 
 
+@lru_cache(maxsize=1024)
 def classify_traffic(duration_normal: int, duration_traffic: int) -> TrafficInfo:
     """
     Classify traffic condition based on delay.
 
+    Inputs are whole minutes, so results are memoized (TrafficInfo is
+    frozen, which makes sharing one instance between routes safe).
+
     Args:
         duration_normal: Normal duration in minutes (without traffic)
         duration_traffic: Duration with current traffic in minutes
@@ -250,35 +532,60 @@ def classify_traffic(duration_normal: int, duration_traffic: int) -> TrafficInfo
 # PLACES HELPER
 # =============================================================================
 
-def _get_places_along_route(
-    gmaps: googlemaps.Client,
-    waypoints: List[RoutePoint],
-    place_types: List[str],
-    search_radius_meters: int = 1609,  # 1 mile
-    max_places_per_type: int = 3
-) -> List[PlaceInfo]:
+async def _places_nearby(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    point: RoutePoint,
+    place_type: str,
+    search_radius_meters: int,
+    max_places_per_type: int
+) -> Optional[List[PlaceInfo]]:
     """
-    Find places of interest along the route.
+    Run one Places Nearby search around a waypoint.
 
-    Samples strategic waypoints (start, middle, end) and searches for
-    nearby places to avoid excessive API calls.
+    Failures are logged and return None - places are optional.
+    """
+    params = {
+        "location": f"{point.latitude},{point.longitude}",
+        "radius": search_radius_meters,
+        "type": place_type,
+        "key": GOOGLE_API_KEY,
+    }
 
-    Args:
-        gmaps: Google Maps client
-        waypoints: List of route waypoints
-        place_types: Types to search for (e.g., ["gas_station", "police"])
-        search_radius_meters: Search radius around each point
-        max_places_per_type: Max places to return per type per location
+    try:
+        async with semaphore, _rate_limiters["places"]:
+            response = await client.get(PLACES_NEARBY_URL, params=params)
+        response.raise_for_status()
+        data = response.json()
+
+        status = data.get("status")
+        if status not in ("OK", "ZERO_RESULTS"):
+            raise ValueError(f"{status}: {data.get('error_message', '')}")
+    except Exception as e:
+        # Log but don't fail - places are optional
+        print(f"Warning: Places search failed for {place_type}: {e}")
+        return None
 
-    Returns:
-        List of PlaceInfo objects
-    """
     places = []
+    for result in data.get("results", [])[:max_places_per_type]:
+        loc = result["geometry"]["location"]
+        places.append(PlaceInfo(
+            name=result.get("name", "Unknown"),
+            place_type=place_type,
+            latitude=loc["lat"],
+            longitude=loc["lng"],
+            vicinity=result.get("vicinity")
+        ))
+    return places
+
 
-    if not waypoints:
-        return places
+def _strategic_points(waypoints: List[RoutePoint]) -> List[RoutePoint]:
+    """
+    Pick the waypoints to run places searches around.
 
-    # Sample strategic points: start, 25%, 50%, 75%, end
+    Samples strategic waypoints (start, 25%, middle, 75%, end) to avoid
+    excessive API calls.
+    """
     num_waypoints = len(waypoints)
     if num_waypoints <= 3:
         sample_indices = list(range(num_waypoints))
@@ -293,90 +600,226 @@ def _get_places_along_route(
         # Remove duplicates while preserving order
         sample_indices = list(dict.fromkeys(sample_indices))
 
-    sample_points = [waypoints[i] for i in sample_indices]
+    return [waypoints[i] for i in sample_indices]
 
-    for point in sample_points:
-        for place_type in place_types:
-            try:
-                results = gmaps.places_nearby(
-                    location=(point.latitude, point.longitude),
-                    radius=search_radius_meters,
-                    type=place_type
-                )
 
-                for result in results.get("results", [])[:max_places_per_type]:
-                    loc = result["geometry"]["location"]
-                    places.append(PlaceInfo(
-                        name=result.get("name", "Unknown"),
-                        place_type=place_type,
-                        latitude=loc["lat"],
-                        longitude=loc["lng"],
-                        vicinity=result.get("vicinity")
-                    ))
-            except Exception as e:
-                # Log but don't fail - places are optional
-                print(f"Warning: Places search failed for {place_type}: {e}")
-                continue
+async def _get_places_along_routes(
+    routes: List[RouteData],
+    place_types: List[str],
+    search_radius_meters: int = 1609,  # 1 mile
+    max_places_per_type: int = 3,
+    client: Optional[httpx.AsyncClient] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> List[List[PlaceInfo]]:
+    """
+    Find places of interest along every route alternative.
 
-    return places
+    The searches for all routes, points and place types are fanned out in
+    one batch over a shared client (at most MAX_CONCURRENT_PLACES_REQUESTS
+    in flight), instead of one batch per route. Searches are cached
+    in-process per ~110 m cell, so overlapping alternatives and repeat
+    queries only hit the network once.
+
+    Args:
+        routes: Route alternatives whose waypoints to search around
+        place_types: Types to search for (e.g., ["gas_station", "police"])
+        search_radius_meters: Search radius around each point
+        max_places_per_type: Max places to return per type per location
+        client: Client to reuse (default: a new one for this batch)
+        semaphore: Concurrency limit to share with other batches (default:
+            a new one allowing MAX_CONCURRENT_PLACES_REQUESTS)
+
+    Returns:
+        One list of PlaceInfo objects per route, in route order
+    """
+    # Cache key per (route index, search), so results can be scattered back;
+    # searches falling in the same cell are sent once. Cache hits are kept
+    # in `found` so this call's own inserts cannot evict them
+    searches = []
+    found: Dict[tuple, List[PlaceInfo]] = {}
+    pending: Dict[tuple, RoutePoint] = {}
+    with _cache_lock:
+        for route_index, route in enumerate(routes):
+            for point in _strategic_points(route.waypoints):
+                for place_type in place_types:
+                    key = (
+                        round(point.latitude, PLACES_CACHE_DECIMALS),
+                        round(point.longitude, PLACES_CACHE_DECIMALS),
+                        place_type,
+                        search_radius_meters,
+                        max_places_per_type,
+                    )
+                    searches.append((route_index, key))
+                    if key in found or key in pending:
+                        continue
+                    cached = _places_cache.get(key)
+                    if cached is not None:
+                        _places_cache.move_to_end(key)
+                        found[key] = cached
+                    else:
+                        pending[key] = point
+
+    if pending:
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_PLACES_REQUESTS)
+
+        async def search_all(search_client: httpx.AsyncClient) -> List[Optional[List[PlaceInfo]]]:
+            return await asyncio.gather(*(
+                _places_nearby(
+                    search_client, semaphore, point, key[2],
+                    search_radius_meters, max_places_per_type
+                )
+                for key, point in pending.items()
+            ))
+
+        if client is not None:
+            results = await search_all(client)
+        else:
+            async with httpx.AsyncClient(
+                timeout=30.0, http2=True, limits=GOOGLE_HTTP_LIMITS
+            ) as own_client:
+                results = await search_all(own_client)
+        with _cache_lock:
+            for key, places in zip(pending, results):
+                # Failed searches are not cached so they are retried next time
+                if places is not None:
+                    found[key] = places
+                    _places_cache[key] = places
+                    if len(_places_cache) > PLACES_CACHE_MAX_ENTRIES:
+                        _places_cache.popitem(last=False)
+
+    places_per_route: List[List[PlaceInfo]] = [[] for _ in routes]
+    for route_index, key in searches:
+        places = found.get(key)
+        if places is not None:
+            places_per_route[route_index].extend(places)
+    return places_per_route
 
 
 # =============================================================================
-# MAIN FUNCTION
+# DIRECTIONS
 # =============================================================================
 
-def use_google_maps(
+def _request_directions(directions_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Call the Directions API and keep only the route fields we read.
+
+    Goes straight to the REST endpoint over httpx (USE_GMAPS_SDK=1 uses
+    the googlemaps SDK instead), throttled by the "directions" rate limiter.
+
+    Returns:
+        Routes, each with summary, overview_polyline and its first leg
+
+    Raises:
+        googlemaps.exceptions.ApiError: On a non-OK status via the SDK
+        ValueError: On a non-OK status via the REST endpoint
+        httpx.HTTPError: On transport or HTTP errors
+    """
+    if USE_GMAPS_SDK:
+        with _rate_limiters["directions"]:
+            routes = _client().directions(**directions_params)
+    else:
+        params = {
+            **directions_params,
+            "alternatives": "true" if directions_params.get("alternatives") else "false",
+            "key": GOOGLE_API_KEY,
+        }
+        with _rate_limiters["directions"]:
+            response = _http_client().get(DIRECTIONS_URL, params=params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        status = data.get("status")
+        if status == "ZERO_RESULTS":
+            return []
+        if status != "OK":
+            raise ValueError(
+                f"Google Maps API error: {status}: {data.get('error_message', '')}"
+            )
+        routes = data.get("routes", [])
+
+    return [_slim_route(route) for route in routes]
+
+
+def _slim_route(route: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a Directions route with only the fields _get_routes reads."""
+    leg = route["legs"][0]
+    slim = {
+        "overview_polyline": {"points": route["overview_polyline"]["points"]},
+        "legs": [{key: leg[key] for key in DIRECTIONS_LEG_FIELDS if key in leg}],
+    }
+    if "summary" in route:
+        slim["summary"] = route["summary"]
+    return slim
+
+
+def _directions_cache_path(params: Dict[str, Any]) -> Optional[Path]:
+    """File the directions response for these params is cached in, if enabled."""
+    if not DIRECTIONS_CACHE_DIR:
+        return None
+    key = json.dumps(params, sort_keys=True)
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return Path(DIRECTIONS_CACHE_DIR).expanduser() / f"directions-{digest}.json"
+
+
+def _load_cached_directions(path: Optional[Path]) -> Optional[List[Dict[str, Any]]]:
+    """Read a cached directions response, or None if missing or expired."""
+    if path is None:
+        return None
+    try:
+        if time.time() - path.stat().st_mtime > DIRECTIONS_CACHE_TTL_SECONDS:
+            return None
+        return json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cached_directions(path: Optional[Path], directions_result: List[Dict[str, Any]]) -> None:
+    """Write a directions response to the cache and drop expired entries."""
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        for old in path.parent.glob("directions-*.json"):
+            try:
+                if now - old.stat().st_mtime > DIRECTIONS_CACHE_TTL_SECONDS:
+                    old.unlink()
+            except OSError:
+                # Already removed by a concurrent save; keep pruning
+                continue
+        # Write then rename so a concurrent reader never sees a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(directions_result))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # Caching is best-effort
+        print(f"Warning: Could not cache directions: {e}")
+
+
+def _get_routes(
     start: str,
     destination: str,
-    include_traffic: bool = True,
-    include_places: bool = True,
-    place_types: Optional[List[str]] = None
+    include_traffic: bool,
+    sample_waypoints: bool
 ) -> List[RouteData]:
     """
-    Get route alternatives between two addresses with adaptive waypoints.
+    Fetch route alternatives from the Directions API and build RouteData.
 
-    This is the main function for Phase 2. It:
-    1. Calls Google Directions API with alternatives=True
-    2. Extracts route geometry from polylines
-    3. Samples waypoints at adaptive intervals (denser in urban areas)
-    4. Optionally fetches real-time traffic data
-    5. Optionally finds places of interest along the route
+    Places are not filled in here; see _get_places_along_routes.
 
     Args:
-        start: Starting address (e.g., "Willis Tower, Chicago, IL")
-        destination: Destination address (e.g., "Navy Pier, Chicago, IL")
+        start: Starting address
+        destination: Destination address
         include_traffic: Whether to fetch real-time traffic data
-        include_places: Whether to fetch places along route
-        place_types: Place types to search for (default: gas_station, police)
+        sample_waypoints: Whether to decode the polyline into waypoints
 
     Returns:
         List of RouteData objects, one per route alternative
 
     Raises:
-        ValueError: If API key not set or invalid addresses
-
-    Example:
-        >>> routes = use_google_maps(
-        ...     start="Willis Tower, Chicago, IL",
-        ...     destination="Navy Pier, Chicago, IL"
-        ... )
-        >>> for route in routes:
-        ...     print(f"Route {route.route_id}: {route.summary}")
-        ...     print(f"  Distance: {route.distance_miles} miles")
-        ...     print(f"  Waypoints: {len(route.waypoints)}")
+        ValueError: If the request fails or no route is found
     """
-    if not GOOGLE_API_KEY:
-        raise ValueError(
-            "GOOGLE_MAPS_API_KEY environment variable not set. "
-            "Please add it to your .env file."
-        )
-
-    if place_types is None:
-        place_types = ["gas_station", "police"]
-
-    # Initialize Google Maps client
-    gmaps = googlemaps.Client(key=GOOGLE_API_KEY)
-
     # Build directions request parameters
     directions_params = {
         "origin": start,
@@ -390,13 +833,21 @@ def use_google_maps(
         directions_params["departure_time"] = "now"
         directions_params["traffic_model"] = "best_guess"
 
-    # Call Google Directions API
-    try:
-        directions_result = gmaps.directions(**directions_params)
-    except googlemaps.exceptions.ApiError as e:
-        raise ValueError(f"Google Maps API error: {e}")
-    except Exception as e:
-        raise ValueError(f"Failed to get directions: {e}")
+    # Call Google Directions API (unless answered within the hour; live
+    # traffic requests always go to the API)
+    cache_path = None if include_traffic else _directions_cache_path(directions_params)
+    directions_result = _load_cached_directions(cache_path)
+    if directions_result is None:
+        try:
+            directions_result = _request_directions(directions_params)
+        except googlemaps.exceptions.ApiError as e:
+            raise ValueError(f"Google Maps API error: {e}")
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to get directions: {e}")
+        if directions_result:
+            _save_cached_directions(cache_path, directions_result)
 
     if not directions_result:
         raise ValueError(
@@ -427,22 +878,12 @@ def use_google_maps(
         # Get overview polyline (encoded path)
         overview_polyline = route["overview_polyline"]["points"]
 
-        # Calculate adaptive sampling interval
-        interval = get_adaptive_interval(distance_miles)
-
-        # Sample waypoints from polyline
-        waypoints = sample_points_from_polyline(
-            encoded_polyline=overview_polyline,
-            interval_miles=interval
-        )
-
-        # Get places along route (optional)
-        places = []
-        if include_places and waypoints:
-            places = _get_places_along_route(
-                gmaps=gmaps,
-                waypoints=waypoints,
-                place_types=place_types
+        # Sample waypoints at an adaptive interval
+        waypoints = []
+        if sample_waypoints:
+            waypoints = sample_points_from_polyline(
+                encoded_polyline=overview_polyline,
+                interval_miles=get_adaptive_interval(distance_miles)
             )
 
         # Create RouteData object
@@ -455,8 +896,7 @@ def use_google_maps(
             end_address=leg["end_address"],
             waypoints=waypoints,
             polyline=overview_polyline,
-            traffic=traffic_info,
-            places_along_route=places
+            traffic=traffic_info
         )
 
         routes.append(route_data)
@@ -464,58 +904,506 @@ def use_google_maps(
     return routes
 
 
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+async def use_google_maps_async(
+    start: str,
+    destination: str,
+    include_traffic: bool = True,
+    include_places: bool = True,
+    place_types: Optional[List[str]] = None,
+    return_waypoints: bool = True
+) -> List[RouteData]:
+    """
+    Get route alternatives between two addresses with adaptive waypoints.
+
+    This is the main function for Phase 2. It:
+    1. Calls Google Directions API with alternatives=True
+    2. Extracts route geometry from polylines
+    3. Samples waypoints at adaptive intervals (denser in urban areas)
+    4. Optionally fetches real-time traffic data
+    5. Optionally finds places of interest along the route
+
+    Args:
+        start: Starting address (e.g., "Willis Tower, Chicago, IL")
+        destination: Destination address (e.g., "Navy Pier, Chicago, IL")
+        include_traffic: Whether to fetch real-time traffic data
+        include_places: Whether to fetch places along route
+        place_types: Place types to search for (default: gas_station, police)
+        return_waypoints: Whether to sample waypoints; with False (and no
+            places) the polyline is never decoded and waypoints stay empty
+
+    Returns:
+        List of RouteData objects, one per route alternative
+
+    Raises:
+        ValueError: If API key not set or invalid addresses
+
+    Example:
+        >>> routes = await use_google_maps_async(
+        ...     start="Willis Tower, Chicago, IL",
+        ...     destination="Navy Pier, Chicago, IL"
+        ... )
+        >>> for route in routes:
+        ...     print(f"Route {route.route_id}: {route.summary}")
+        ...     print(f"  Distance: {route.distance_miles} miles")
+        ...     print(f"  Waypoints: {len(route.waypoints)}")
+    """
+    if not GOOGLE_API_KEY:
+        raise ValueError(
+            "GOOGLE_MAPS_API_KEY environment variable not set. "
+            "Please add it to your .env file."
+        )
+
+    if place_types is None:
+        place_types = ["gas_station", "police"]
+
+    # Directions go through a blocking client, so keep them off the event loop
+    routes = await asyncio.to_thread(
+        _get_routes,
+        start=start,
+        destination=destination,
+        include_traffic=include_traffic,
+        # Places are searched around the waypoints, so they are needed for that too
+        sample_waypoints=return_waypoints or include_places
+    )
+
+    # Get places along all routes in one concurrent batch (optional)
+    if include_places:
+        places_per_route = await _get_places_along_routes(
+            routes=routes,
+            place_types=place_types
+        )
+        for route_data, places in zip(routes, places_per_route):
+            route_data.places_along_route = places
+            if not return_waypoints:
+                route_data.waypoints = []
+
+    return routes
+
+
+def use_google_maps(
+    start: str,
+    destination: str,
+    include_traffic: bool = True,
+    include_places: bool = True,
+    place_types: Optional[List[str]] = None,
+    return_waypoints: bool = True
+) -> List[RouteData]:
+    """
+    Sync wrapper around use_google_maps_async for non-async callers.
+
+    Safe to call while an event loop is running (the work then runs in a
+    worker thread), but async code should await use_google_maps_async.
+
+    Args:
+        start: Starting address (e.g., "Willis Tower, Chicago, IL")
+        destination: Destination address (e.g., "Navy Pier, Chicago, IL")
+        include_traffic: Whether to fetch real-time traffic data
+        include_places: Whether to fetch places along route
+        place_types: Place types to search for (default: gas_station, police)
+        return_waypoints: Whether to sample waypoints (see use_google_maps_async)
+
+    Returns:
+        List of RouteData objects, one per route alternative
+
+    Raises:
+        ValueError: If API key not set or invalid addresses
+
+    Example:
+        >>> routes = use_google_maps(
+        ...     start="Willis Tower, Chicago, IL",
+        ...     destination="Navy Pier, Chicago, IL"
+        ... )
+    """
+    return _run_sync(use_google_maps_async(
+        start=start,
+        destination=destination,
+        include_traffic=include_traffic,
+        include_places=include_places,
+        place_types=place_types,
+        return_waypoints=return_waypoints
+    ))
+
+
+async def use_google_maps_stream(
+    start: str,
+    destination: str,
+    include_traffic: bool = True,
+    include_places: bool = True,
+    place_types: Optional[List[str]] = None
+) -> AsyncIterator[RouteData]:
+    """
+    Async variant of use_google_maps that yields each route as it completes.
+
+    Each alternative's places search runs as its own task, so an interactive
+    caller can show the first finished route without waiting for the rest.
+    Routes arrive in completion order, not route_id order. The tasks share
+    one client and one MAX_CONCURRENT_PLACES_REQUESTS limit, and are
+    cancelled if the caller stops iterating early.
+
+    Args:
+        start: Starting address
+        destination: Destination address
+        include_traffic: Whether to fetch real-time traffic data
+        include_places: Whether to fetch places along each route
+        place_types: Place types to search for (default: gas_station, police)
+
+    Yields:
+        RouteData objects, fastest to finish first
+
+    Raises:
+        ValueError: If API key not set or invalid addresses
+    """
+    if not GOOGLE_API_KEY:
+        raise ValueError(
+            "GOOGLE_MAPS_API_KEY environment variable not set. "
+            "Please add it to your .env file."
+        )
+
+    if place_types is None:
+        place_types = ["gas_station", "police"]
+
+    # Directions go through a blocking client, so keep them off the event loop
+    routes = await asyncio.to_thread(
+        _get_routes,
+        start=start,
+        destination=destination,
+        include_traffic=include_traffic,
+        sample_waypoints=True
+    )
+
+    if not include_places:
+        for route_data in routes:
+            yield route_data
+        return
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PLACES_REQUESTS)
+    async with httpx.AsyncClient(
+        timeout=30.0, http2=True, limits=GOOGLE_HTTP_LIMITS
+    ) as client:
+
+        async def with_places(route_data: RouteData) -> RouteData:
+            places_per_route = await _get_places_along_routes(
+                routes=[route_data],
+                place_types=place_types,
+                client=client,
+                semaphore=semaphore
+            )
+            route_data.places_along_route = places_per_route[0]
+            return route_data
+
+        tasks = [asyncio.create_task(with_places(r)) for r in routes]
+        try:
+            for next_route in asyncio.as_completed(tasks):
+                yield await next_route
+        finally:
+            # Consumer stopped early (or failed): don't leave searches running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _rank_pairs(pairs: List[Tuple[str, str]], include_traffic: bool) -> List[int]:
+    """
+    Order (start, destination) pairs by driving time using Distance Matrix.
+
+    Pairs are grouped by origin and each request sends one origin with up
+    to DISTANCE_MATRIX_MAX_DESTINATIONS of its destinations, so no unused
+    cross elements are billed (duplicate pairs are looked up once).
+
+    Returns:
+        Indices into pairs, fastest first
+
+    Raises:
+        ValueError: If a request fails or Google can't route a pair
+    """
+    gmaps = _client()
+
+    # origin -> its destinations, in first-seen order without duplicates
+    destinations_by_origin: Dict[str, Dict[str, None]] = {}
+    for start, destination in pairs:
+        destinations_by_origin.setdefault(start, {})[destination] = None
+
+    durations: Dict[Tuple[str, str], int] = {}
+    unroutable = []
+    for origin, destinations in destinations_by_origin.items():
+        destinations = list(destinations)
+        for offset in range(0, len(destinations), DISTANCE_MATRIX_MAX_DESTINATIONS):
+            chunk = destinations[offset:offset + DISTANCE_MATRIX_MAX_DESTINATIONS]
+            matrix_params = {
+                "origins": [origin],
+                "destinations": chunk,
+                "mode": "driving",
+            }
+            if include_traffic:
+                matrix_params["departure_time"] = "now"
+
+            try:
+                with _rate_limiters["distance_matrix"]:
+                    matrix = gmaps.distance_matrix(**matrix_params)
+            except googlemaps.exceptions.ApiError as e:
+                raise ValueError(f"Google Maps API error: {e}")
+            except Exception as e:
+                raise ValueError(f"Failed to get distance matrix: {e}")
+
+            rows = matrix.get("rows") or [{}]
+            elements = rows[0].get("elements", [])
+            for i, destination in enumerate(chunk):
+                element = elements[i] if i < len(elements) else {}
+                if element.get("status") != "OK":
+                    unroutable.append(f"'{origin}' -> '{destination}' ({element.get('status')})")
+                    continue
+                duration = element.get("duration_in_traffic") or element["duration"]
+                durations[(origin, destination)] = duration["value"]
+
+    if unroutable:
+        raise ValueError(f"No routes found for: {'; '.join(unroutable)}")
+
+    return sorted(range(len(pairs)), key=lambda i: durations[pairs[i]])
+
+
+def use_google_maps_many(
+    pairs: List[Tuple[str, str]],
+    top_k: Optional[int] = None,
+    include_traffic: bool = True,
+    include_places: bool = True,
+    place_types: Optional[List[str]] = None
+) -> Dict[Tuple[str, str], List[RouteData]]:
+    """
+    Get route alternatives for several (start, destination) pairs.
+
+    When top_k keeps fewer than all pairs, ranks them with Distance Matrix
+    (one billed element per pair) first; otherwise ranking is skipped.
+    Full routes (same shape as use_google_maps) are then fetched for the
+    selected pairs concurrently.
+
+    Args:
+        pairs: (start, destination) address pairs, e.g. the legs of a trip
+        top_k: Number of fastest pairs to fetch full routes for (default: all)
+        include_traffic: Whether to fetch real-time traffic data
+        include_places: Whether to fetch places along each route
+        place_types: Place types to search for (default: gas_station, police)
+
+    Returns:
+        Dict mapping each selected pair to its routes; fastest pair first
+        when ranked, input order otherwise
+
+    Raises:
+        ValueError: If API key not set, a lookup fails or a pair has no route
+    """
+    if not GOOGLE_API_KEY:
+        raise ValueError(
+            "GOOGLE_MAPS_API_KEY environment variable not set. "
+            "Please add it to your .env file."
+        )
+
+    if top_k is None or top_k >= len(pairs):
+        # Every pair is fetched anyway, so ranking would only cost requests
+        selected = list(pairs)
+    else:
+        selected = [pairs[i] for i in _rank_pairs(pairs, include_traffic)[:top_k]]
+
+    if place_types is None:
+        place_types = ["gas_station", "police"]
+
+    async def fetch_all() -> List[List[RouteData]]:
+        # Directions go through the blocking SDK, so each pair runs in a worker
+        # thread; places for every pair's routes then go out as one batch
+        routes_per_pair = await asyncio.gather(*(
+            asyncio.to_thread(
+                _get_routes,
+                start=start,
+                destination=destination,
+                include_traffic=include_traffic,
+                sample_waypoints=True
+            )
+            for start, destination in selected
+        ))
+
+        if include_places:
+            all_routes = [route for routes in routes_per_pair for route in routes]
+            places_per_route = await _get_places_along_routes(
+                routes=all_routes,
+                place_types=place_types
+            )
+            for route_data, places in zip(all_routes, places_per_route):
+                route_data.places_along_route = places
+
+        return routes_per_pair
+
+    return dict(zip(selected, _run_sync(fetch_all())))
+
+
 # =============================================================================
 # OPTIONAL: Enrich waypoints with city names
 # =============================================================================
 
+async def _reverse_geocode(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    latitude: float,
+    longitude: float,
+    api_key: str
+) -> Optional[tuple]:
+    """
+    Reverse geocode one location.
+
+    Returns:
+        (description, area_type), or None if the request failed (including
+        a non-OK status such as OVER_QUERY_LIMIT or REQUEST_DENIED)
+    """
+    params = {
+        "latlng": f"{latitude},{longitude}",
+        "result_type": "locality|neighborhood|sublocality",
+        "key": api_key,
+    }
+
+    try:
+        async with semaphore, _rate_limiters["geocoding"]:
+            response = await client.get(GEOCODE_URL, params=params)
+        response.raise_for_status()
+        data = response.json()
+    except Exception:
+        return None
+
+    if data.get("status") not in ("OK", "ZERO_RESULTS"):
+        return None
+
+    result = data.get("results")
+
+    if result:
+        # Index names by type in one pass, then take the most specific one
+        names_by_type: Dict[str, str] = {}
+        for component in result[0].get("address_components", []):
+            for component_type in component.get("types", []):
+                names_by_type.setdefault(component_type, component["long_name"])
+        for component_type in GEOCODE_TYPE_PRIORITY:
+            if component_type in names_by_type:
+                # Could determine locality area_type based on population data
+                area_type = "urban" if component_type in URBAN_COMPONENT_TYPES else None
+                return names_by_type[component_type], area_type
+    return None, None
+
+
+async def _enrich_waypoints(routes: List[RouteData], api_key: str) -> None:
+    """
+    Fill in waypoint descriptions, one lookup per uncached location cell.
+
+    Waypoints sharing a cell (within a route or across alternatives) are
+    looked up once; hits in the process-wide LRU cache skip the network
+    and are kept aside, so this call's own inserts cannot evict them.
+    """
+    cells: Dict[tuple, List[RoutePoint]] = {}
+    for route in routes:
+        for waypoint in route.waypoints:
+            key = (
+                round(waypoint.latitude, GEOCODE_CACHE_DECIMALS),
+                round(waypoint.longitude, GEOCODE_CACHE_DECIMALS),
+            )
+            cells.setdefault(key, []).append(waypoint)
+
+    found: Dict[tuple, tuple] = {}
+    missing = []
+    with _cache_lock:
+        for key in cells:
+            location = _geocode_cache.get(key)
+            if location is None:
+                missing.append(key)
+            else:
+                _geocode_cache.move_to_end(key)
+                found[key] = location
+
+    if missing:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_GEOCODE_REQUESTS)
+        async with httpx.AsyncClient(
+            timeout=30.0, http2=True, limits=GOOGLE_HTTP_LIMITS
+        ) as client:
+            results = await asyncio.gather(*(
+                _reverse_geocode(client, semaphore, lat, lon, api_key)
+                for lat, lon in missing
+            ))
+        with _cache_lock:
+            for key, location in zip(missing, results):
+                # Failed lookups are not cached so they are retried next time
+                if location is not None:
+                    found[key] = location
+                    _geocode_cache[key] = location
+                    if len(_geocode_cache) > GEOCODE_CACHE_MAX_ENTRIES:
+                        _geocode_cache.popitem(last=False)
+
+    for key, waypoints in cells.items():
+        location = found.get(key)
+        if location is None:
+            # Continue without description on error
+            continue
+        for waypoint in waypoints:
+            waypoint.description, waypoint.area_type = location
+
+
+async def enrich_waypoints_with_locations_async(routes: List[RouteData]) -> List[RouteData]:
+    """
+    Add city/area descriptions to waypoints via reverse geocoding.
+
+    WARNING: This makes additional API calls (one per waypoint).
+    Use sparingly to avoid rate limits and costs. Calls run concurrently
+    (at most MAX_CONCURRENT_GEOCODE_REQUESTS in flight) and results are
+    cached in-process per ~11 m cell, so repeated locations are free.
+
+    Args:
+        routes: List of RouteData to enrich
+
+    Returns:
+        Same routes with waypoint descriptions populated
+
+    Raises:
+        ValueError: If API key not set
+    """
+    if not GOOGLE_API_KEY:
+        raise ValueError("GOOGLE_MAPS_API_KEY not set")
+
+    await _enrich_waypoints(routes, GOOGLE_API_KEY)
+
+    return routes
+
+
 def enrich_waypoints_with_locations(
     routes: List[RouteData],
     gmaps_client: Optional[googlemaps.Client] = None
 ) -> List[RouteData]:
     """
-    Add city/area descriptions to waypoints via reverse geocoding.
+    Sync wrapper around enrich_waypoints_with_locations_async.
 
-    WARNING: This makes additional API calls (one per waypoint).
-    Use sparingly to avoid rate limits and costs.
+    Safe to call while an event loop is running (the work then runs in a
+    worker thread), but async code should await the async variant.
 
     Args:
         routes: List of RouteData to enrich
-        gmaps_client: Optional Google Maps client (creates new if not provided)
+        gmaps_client: Deprecated; lookups now go through the REST API, but
+            a given client's API key is still used
 
     Returns:
         Same routes with waypoint descriptions populated
+
+    Raises:
+        ValueError: If API key not set
     """
-    if gmaps_client is None:
-        if not GOOGLE_API_KEY:
-            raise ValueError("GOOGLE_MAPS_API_KEY not set")
-        gmaps_client = googlemaps.Client(key=GOOGLE_API_KEY)
+    api_key = GOOGLE_API_KEY
+    if gmaps_client is not None:
+        warnings.warn(
+            "enrich_waypoints_with_locations(gmaps_client=...) is deprecated; "
+            "only the client's API key is used",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        api_key = gmaps_client.key
 
-    for route in routes:
-        for waypoint in route.waypoints:
-            try:
-                result = gmaps_client.reverse_geocode(
-                    (waypoint.latitude, waypoint.longitude),
-                    result_type=["locality", "neighborhood", "sublocality"]
-                )
-                if result:
-                    # Extract the most specific location name
-                    for component in result[0].get("address_components", []):
-                        types = component.get("types", [])
-                        if "neighborhood" in types:
-                            waypoint.description = component["long_name"]
-                            waypoint.area_type = "urban"
-                            break
-                        elif "sublocality" in types:
-                            waypoint.description = component["long_name"]
-                            waypoint.area_type = "urban"
-                            break
-                        elif "locality" in types:
-                            waypoint.description = component["long_name"]
-                            # Could determine area_type based on population data
-                            break
-            except Exception:
-                # Continue without description on error
-                pass
+    if not api_key:
+        raise ValueError("GOOGLE_MAPS_API_KEY not set")
+
+    _run_sync(_enrich_waypoints(routes, api_key))
 
     return routes
 
@@ -0,0 +1,168 @@
+"""Shared pytest fixtures.
+
+The Crime MCP server subprocess and its client connection are session
+scoped, so a pytest run starts the server and performs the MCP handshake
+once no matter how many test modules use them. Live Google Maps lookups
+are memoized per session for the same reason.
+"""
+import functools
+import glob
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlparse
+
+import pytest
+import pytest_asyncio
+from fastmcp import Client
+
+MCP_URL = "http://localhost:8001/mcp"
+SERVER_STARTUP_WAIT = 15  # max seconds to wait for server to accept connections
+SERVER_POLL_INTERVAL = 0.1  # seconds between readiness probes
+TESTS_DIR = os.path.dirname(__file__)
+
+
+def _probe_server(host: str, port: int) -> bool:
+    """Return True once the server accepts TCP connections on host:port."""
+    try:
+        with socket.create_connection((host, port), timeout=SERVER_POLL_INTERVAL):
+            return True
+    except OSError:
+        return False
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Merge per-worker phase 1 result files written under pytest-xdist."""
+    if hasattr(session.config, "workerinput"):
+        return  # xdist worker; only the controller merges
+
+    results_file = os.path.join(TESTS_DIR, "phase1_crime_mcp_results.json")
+    parts = sorted(glob.glob(os.path.join(TESTS_DIR, "phase1_crime_mcp_results.gw*.json")))
+    if not parts:
+        return
+
+    merged = None
+    for part in parts:
+        with open(part) as f:
+            data = json.load(f)
+        if merged is None:
+            merged = data
+        else:
+            merged["tests"].extend(data["tests"])
+        os.remove(part)
+
+    with open(results_file, "w") as f:
+        json.dump(merged, f, indent=2, default=str)
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """Start the MCP server once per test session for integration tests."""
+    # A readiness probe can't tell our server from another process on the
+    # port (a stale server, another xdist worker), so refuse to start then
+    url = urlparse(MCP_URL)
+    if _probe_server(url.hostname, url.port):
+        pytest.fail(
+            f"Port {url.port} is already in use; stop the process holding it "
+            "before running the integration tests"
+        )
+
+    env = os.environ.copy()
+    # Skip .pyc writes and stdio buffering in the child to trim cold start
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    env["PYTHONUNBUFFERED"] = "1"
+
+    err_tmp = tempfile.TemporaryFile()
+
+    # sys.executable keeps the server on this interpreter/venv (no PATH lookup);
+    # -S is not an option since the server imports from site-packages
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.MCP_Servers.crime_mcp"],
+        env=env,
+        # Undrained PIPEs would stall the server once its logs fill the OS
+        # buffer; stderr goes to a temp file so startup failures can report it
+        stdout=subprocess.DEVNULL,
+        stderr=err_tmp,
+        cwd=os.path.join(TESTS_DIR, "..", ".."),
+    )
+
+    # Poll until the server's port accepts connections instead of sleeping
+    # for the worst-case startup time (a TCP connect is far cheaper than a
+    # full MCP handshake)
+    ready = False
+    deadline = time.monotonic() + SERVER_STARTUP_WAIT
+    while process.poll() is None and time.monotonic() < deadline:
+        if _probe_server(url.hostname, url.port):
+            # Only ready if the listener is ours, i.e. our child is still alive
+            ready = process.poll() is None
+            break
+        time.sleep(SERVER_POLL_INTERVAL)
+
+    if not ready:
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+        err_tmp.seek(0)
+        stderr = err_tmp.read().decode(errors="replace")
+        err_tmp.close()
+        pytest.fail(f"Server failed to start. stderr: {stderr[:500]}")
+
+    yield process
+
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+    err_tmp.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_client(mcp_server):
+    """One connected fastmcp Client shared by all integration tests in the session."""
+    async with Client(MCP_URL) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def google_routes():
+    """
+    Session-memoized use_google_maps for live tests.
+
+    Live tests repeat the same few (start, destination, flags) queries;
+    each unique query hits Google once per session. Returned routes are
+    shared between tests, so tests must not mutate them.
+    """
+    from src.helper_functions.google_maps import use_google_maps
+
+    @functools.lru_cache(maxsize=64)
+    def _cached(start, destination, include_traffic, include_places, place_types):
+        return use_google_maps(
+            start=start,
+            destination=destination,
+            include_traffic=include_traffic,
+            include_places=include_places,
+            place_types=list(place_types) if place_types else None,
+        )
+
+    def get_routes(
+        start: str,
+        destination: str,
+        include_traffic: bool = True,
+        include_places: bool = True,
+        place_types=None,
+    ):
+        return _cached(
+            start,
+            destination,
+            include_traffic,
+            include_places,
+            tuple(place_types) if place_types else None,
+        )
+
+    return get_routes
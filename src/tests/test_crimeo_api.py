@@ -7,11 +7,15 @@ Usage:
     python src/tests/test_crimeo_api.py
 
 Output:
-    Prints JSON responses and saves results to src/tests/crimeo_api_results.json
+    Prints JSON responses and saves results to src/tests/crimeo_api_results.json.gz
+    (read back with: gzip -dc src/tests/crimeo_api_results.json.gz)
 """
 import os
+import gzip
 import json
 import httpx
+import orjson
+import pytest
 import time
 from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
@@ -41,10 +45,47 @@ HEADERS = {
     "x-api-key": API_KEY,
 }
 
-RESULTS_FILE = os.path.join(os.path.dirname(__file__), "crimeo_api_results.json")
+RESULTS_FILE = os.path.join(os.path.dirname(__file__), "crimeo_api_results.json.gz")
 
-# Delay between API calls to respect rate limits
-CALL_DELAY_SECONDS = 3
+# Client-side rate limit for API calls (the shared test key is throttled)
+CALLS_PER_SECOND = 1.0
+
+# Earliest time (time.monotonic) the next API call may start
+_next_call_at = 0.0
+
+
+def make_http_client() -> httpx.Client:
+    """One HTTP/2 client for all calls, so they share a single TLS connection."""
+    return httpx.Client(timeout=30.0, http2=True)
+
+
+@pytest.fixture(scope="module")
+def http_client():
+    """Shared client for the endpoint tests when run under pytest."""
+    with make_http_client() as client:
+        yield client
+
+
+def wait_for_rate_limit():
+    """Block until the next API call is allowed, then reserve its slot."""
+    global _next_call_at
+    now = time.monotonic()
+    if _next_call_at > now:
+        time.sleep(_next_call_at - now)
+        now = _next_call_at
+    _next_call_at = now + 1 / CALLS_PER_SECOND
+
+
+def honor_retry_after(response):
+    """On a 429, push the next call back by the server's Retry-After."""
+    global _next_call_at
+    if response.status_code != 429:
+        return
+    try:
+        retry_after = float(response.headers.get("Retry-After", 0))
+    except ValueError:
+        return
+    _next_call_at = max(_next_call_at, time.monotonic() + retry_after)
 
 
 def test_date_range_helper():
@@ -73,7 +114,7 @@ def test_date_range_helper():
     }
 
 
-def test_coverage_endpoint():
+def test_coverage_endpoint(http_client: httpx.Client):
     """Test the /v1/incidents/raw-data-coverage endpoint (no params needed)."""
     print("\n" + "=" * 60)
     print("TEST 2: Coverage Endpoint")
@@ -85,13 +126,14 @@ def test_coverage_endpoint():
     print(f"Headers: x-api-key: {API_KEY[:8]}...{API_KEY[-4:]}")
     print()
 
-    with httpx.Client(timeout=30.0) as client:
-        response = client.get(url, headers=HEADERS)
+    wait_for_rate_limit()
+    response = http_client.get(url, headers=HEADERS)
+    honor_retry_after(response)
 
     print(f"Status Code: {response.status_code}")
 
     try:
-        data = response.json()
+        data = orjson.loads(response.content)
         if response.status_code == 200:
             if isinstance(data, list) and len(data) > 0:
                 cities = data[0].get("cities", [])
@@ -120,7 +162,7 @@ def test_coverage_endpoint():
     }
 
 
-def test_stats_endpoint():
+def test_stats_endpoint(http_client: httpx.Client):
     """Test the /v1/incidents/stats endpoint."""
     print("\n" + "=" * 60)
     print("TEST 3: Stats Endpoint")
@@ -139,13 +181,14 @@ def test_stats_endpoint():
     print(f"Params: {json.dumps(params, indent=2)}")
     print()
 
-    with httpx.Client(timeout=30.0) as client:
-        response = client.get(url, params=params, headers=HEADERS)
+    wait_for_rate_limit()
+    response = http_client.get(url, params=params, headers=HEADERS)
+    honor_retry_after(response)
 
     print(f"Status Code: {response.status_code}")
 
     try:
-        data = response.json()
+        data = orjson.loads(response.content)
         if response.status_code == 200:
             if isinstance(data, list) and len(data) > 0:
                 total = data[0].get("total_incidents", "N/A")
@@ -175,7 +218,7 @@ def test_stats_endpoint():
     }
 
 
-def test_raw_data_endpoint():
+def test_raw_data_endpoint(http_client: httpx.Client):
     """Test the /v1/incidents/raw-data endpoint."""
     print("\n" + "=" * 60)
     print("TEST 4: Raw Data Endpoint")
@@ -195,13 +238,14 @@ def test_raw_data_endpoint():
     print(f"Params: {json.dumps(params, indent=2)}")
     print()
 
-    with httpx.Client(timeout=30.0) as client:
-        response = client.get(url, params=params, headers=HEADERS)
+    wait_for_rate_limit()
+    response = http_client.get(url, params=params, headers=HEADERS)
+    honor_retry_after(response)
 
     print(f"Status Code: {response.status_code}")
 
     try:
-        data = response.json()
+        data = orjson.loads(response.content)
         if response.status_code == 200:
             if isinstance(data, list) and len(data) > 0:
                 first = data[0]
@@ -267,24 +311,18 @@ def main():
         "tests": [],
     }
 
-    # Run tests with delays between API calls
+    # API calls are spaced by wait_for_rate_limit() (and any Retry-After)
     results["tests"].append(test_date_range_helper())
-
-    print(f"\n(waiting {CALL_DELAY_SECONDS}s between API calls...)")
-    time.sleep(CALL_DELAY_SECONDS)
-    results["tests"].append(test_coverage_endpoint())
-
-    print(f"\n(waiting {CALL_DELAY_SECONDS}s between API calls...)")
-    time.sleep(CALL_DELAY_SECONDS)
-    results["tests"].append(test_stats_endpoint())
-
-    print(f"\n(waiting {CALL_DELAY_SECONDS}s between API calls...)")
-    time.sleep(CALL_DELAY_SECONDS)
-    results["tests"].append(test_raw_data_endpoint())
+    with make_http_client() as http_client:
+        results["tests"].append(test_coverage_endpoint(http_client))
+        results["tests"].append(test_stats_endpoint(http_client))
+        results["tests"].append(test_raw_data_endpoint(http_client))
 
     # Save results to JSON
-    with open(RESULTS_FILE, "w") as f:
-        json.dump(results, f, indent=2, default=str)
+    # Raw-data pages make this file large; gzip level 3 shrinks it several
+    # times over for little CPU
+    with gzip.open(RESULTS_FILE, "wb", compresslevel=3) as f:
+        f.write(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2))
 
     print("\n" + "=" * 60)
     print(f"Results saved to: {RESULTS_FILE}")
@@ -1,8 +1,8 @@
 """Phase 1 Test: Crime MCP Server.
 
 Tests the Crime MCP Server by:
-1. Unit testing the date range helper and config module
-2. Starting the MCP server as a subprocess
+1. Unit testing the date range helper, config module and response cache
+2. Starting the MCP server as a subprocess (session fixture in conftest.py)
 3. Using fastmcp.Client to test tool listing and tool calls
 4. Saving all results to a JSON file
 
@@ -12,23 +12,21 @@ Usage:
 Output:
     Results saved to src/tests/phase1_crime_mcp_results.json
 """
+import asyncio
 import pytest
-import subprocess
-import time
-import signal
 import os
 import json
 from datetime import datetime, timezone
 
-from fastmcp import Client
+import httpx
+
+from src.MCP_Servers.crime_mcp import functions as crime_functions
+from src.tests.conftest import MCP_URL
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-MCP_URL = "http://localhost:8001/mcp"
-SERVER_STARTUP_WAIT = 5  # seconds to wait for server to start
-
 # Test location: Downtown Chicago
 TEST_LAT = 41.8781
 TEST_LON = -87.6298
@@ -51,20 +49,34 @@ _test_results = {
 
 
 def _save_results():
-    """Save accumulated results to JSON file."""
+    """
+    Save accumulated results to JSON file.
+
+    Under pytest-xdist each worker only sees its own tests, so it writes a
+    per-worker file that conftest.py merges into RESULTS_FILE at the end.
+    """
     _test_results["test_metadata"]["timestamp"] = datetime.now(timezone.utc).isoformat()
-    with open(RESULTS_FILE, "w") as f:
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    path = f"{RESULTS_FILE[:-len('.json')]}.{worker_id}.json" if worker_id else RESULTS_FILE
+    with open(path, "w") as f:
         json.dump(_test_results, f, indent=2, default=str)
 
 
 def _record_test(name: str, status: str, details: dict = None):
-    """Record a test result."""
+    """Record a test result in memory (written once by _flush_results)."""
     _test_results["tests"].append({
         "test_name": name,
         "status": status,
         "details": details or {},
     })
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _flush_results():
+    """Write the accumulated results once, after the last test in this module."""
+    yield
     _save_results()
+    print(f"\nPhase 1 test results saved to: {RESULTS_FILE}")
 
 
 # =============================================================================
@@ -164,88 +176,306 @@ class TestConfigLoading:
         })
 
 
-# =============================================================================
-# INTEGRATION TESTS (requires running server)
-# =============================================================================
+STATS_BODY = [{"total_incidents": 5, "report_types": [{"type": "Theft", "count": 5}]}]
+
+
+def _mock_stats_calls(responses, locations=((TEST_LAT, TEST_LON),)):
+    """
+    Call get_crime_stats once per location over a MockTransport.
+
+    Args:
+        responses: httpx.Response objects served in order (one per HTTP request)
+        locations: (lat, lon) to query, in order
+
+    Returns:
+        (results, number of HTTP requests made)
+    """
+    served = iter(responses)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return next(served)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return [
+                await crime_functions.get_crime_stats(
+                    lat, lon, 0.5, 30, "https://crime.test/v1", client
+                )
+                for lat, lon in locations
+            ]
+
+    return asyncio.run(run()), len(requests)
+
+
+class TestResponseCache:
+    """Unit tests for _fetch caching and 429 handling (httpx.MockTransport, no network)."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch):
+        """Fresh response cache per test; Retry-After sleeps are recorded, not slept."""
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(crime_functions, "_response_cache", {})
+        monkeypatch.setattr(crime_functions.asyncio, "sleep", fake_sleep)
+        return sleeps
+
+    def test_hit_within_ttl(self):
+        """A repeat query inside the TTL is served from cache."""
+        results, calls = _mock_stats_calls(
+            [httpx.Response(200, json=STATS_BODY)],
+            locations=[(TEST_LAT, TEST_LON), (TEST_LAT + 0.0001, TEST_LON)],  # same grid cell
+        )
+
+        _record_test("cache_hit_within_ttl", "pass", {"http_calls": calls})
+
+        assert calls == 1
+        assert [r["total_incidents"] for r in results] == [5, 5]
+
+    def test_grid_scales_with_radius(self):
+        """Points ~450 m apart don't share a 0.5 mi query; at 2 mi they do."""
+        near = (TEST_LAT + 0.004, TEST_LON)
+
+        assert crime_functions.grid_cell(TEST_LAT, TEST_LON, 0.5) != crime_functions.grid_cell(*near, 0.5)
+        assert crime_functions.grid_cell(TEST_LAT, TEST_LON, 2.0) == crime_functions.grid_cell(*near, 2.0)
+
+        _, calls = _mock_stats_calls(
+            [httpx.Response(200, json=STATS_BODY)] * 2,
+            locations=[(TEST_LAT, TEST_LON), near],
+        )
+
+        assert calls == 2
+
+    def test_miss_after_expiry(self):
+        """An expired entry is refetched."""
+        _mock_stats_calls([httpx.Response(200, json=STATS_BODY)])
+        cache = crime_functions._response_cache
+        for key, (_, data) in cache.items():
+            cache[key] = (-1.0, data)  # expired long ago
+
+        _, calls = _mock_stats_calls([httpx.Response(200, json=STATS_BODY)])
+
+        _record_test("cache_miss_after_expiry", "pass", {"http_calls": calls})
+
+        assert calls == 1
+
+    def test_eviction_prefers_expired_then_oldest(self, monkeypatch):
+        """When full, expired entries go first; otherwise the oldest entry."""
+        monkeypatch.setattr(crime_functions, "CACHE_MAX_ENTRIES", 2)
+        cache = crime_functions._response_cache
+
+        _mock_stats_calls(
+            [httpx.Response(200, json=STATS_BODY), httpx.Response(200, json=STATS_BODY)],
+            locations=[(41.0, -87.0), (41.1, -87.0)],
+        )
+        key_a, key_b = list(cache)
+        cache[key_b] = (-1.0, cache[key_b][1])  # b has expired
+
+        _mock_stats_calls([httpx.Response(200, json=STATS_BODY)], locations=[(41.2, -87.0)])
+        key_c = list(cache)[-1]
+
+        assert list(cache) == [key_a, key_c]  # expired b evicted, not older a
+
+        _mock_stats_calls([httpx.Response(200, json=STATS_BODY)], locations=[(41.3, -87.0)])
+
+        _record_test("cache_eviction", "pass", {"entries": len(cache)})
+
+        assert key_a not in cache  # nothing expired: oldest evicted
+        assert key_c in cache
+        assert len(cache) == 2
+
+    def test_429_then_200_retries_once(self, empty_cache):
+        """A 429 is retried once after Retry-After, and the success is returned."""
+        results, calls = _mock_stats_calls([
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200, json=STATS_BODY),
+        ])
+
+        _record_test("retry_429_then_200", "pass", {"http_calls": calls, "sleeps": empty_cache})
+
+        assert calls == 2
+        assert empty_cache == [2.0]
+        assert results[0]["total_incidents"] == 5
+
+    def test_429_twice_returns_rate_limit_error(self, empty_cache):
+        """A second 429 gives up with the rate-limit dict."""
+        results, calls = _mock_stats_calls([
+            httpx.Response(429, headers={"Retry-After": "999"}),
+            httpx.Response(429),
+        ])
+
+        _record_test("retry_429_twice", "pass", {"http_calls": calls, "result": results[0]})
 
-@pytest.fixture(scope="module")
-def mcp_server():
-    """Start the MCP server as a subprocess for integration tests."""
-    env = os.environ.copy()
-
-    process = subprocess.Popen(
-        ["python", "-m", "src.MCP_Servers.crime_mcp"],
-        env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        cwd=os.path.join(os.path.dirname(__file__), "..", ".."),
-    )
-
-    time.sleep(SERVER_STARTUP_WAIT)
-
-    if process.poll() is not None:
-        stdout = process.stdout.read().decode() if process.stdout else ""
-        stderr = process.stderr.read().decode() if process.stderr else ""
-        _record_test("server_start", "fail", {
-            "stdout": stdout[:500],
-            "stderr": stderr[:500],
+        assert calls == 2
+        assert empty_cache == [crime_functions.MAX_RETRY_AFTER_SECONDS]  # capped
+        assert results[0]["error"] == "Rate limit exceeded"
+        assert results[0]["status_code"] == 429
+
+    def test_429_is_not_cached(self):
+        """Rate-limited responses are not cached; the next call goes to the network."""
+        _mock_stats_calls([httpx.Response(429), httpx.Response(429)])
+
+        assert crime_functions._response_cache == {}
+
+        results, calls = _mock_stats_calls([httpx.Response(200, json=STATS_BODY)])
+
+        _record_test("no_cache_on_429", "pass", {"http_calls": calls})
+
+        assert calls == 1
+        assert results[0]["total_incidents"] == 5
+
+
+class TestRouteCrimeStatsValidation:
+    """Unit tests for get_route_crime_stats input validation."""
+
+    def test_invalid_point_returns_error(self, monkeypatch):
+        """A point without latitude/longitude returns an error dict, not KeyError."""
+        # Importing the server loads settings, which require an API key
+        monkeypatch.setenv("CRIME_API_KEY", os.getenv("CRIME_API_KEY", "test"))
+        from src.MCP_Servers.crime_mcp.server import get_route_crime_stats
+
+        result = asyncio.run(get_route_crime_stats(points=[{"lat": 1}]))
+
+        _record_test("route_stats_invalid_point", "pass", {"result": str(result)[:300]})
+
+        assert "error" in result
+        assert "latitude" in result["error"]
+
+
+class TestRouteCrimeStatsWorkers:
+    """Unit tests for the get_route_crime_stats worker pool (httpx.MockTransport, no server)."""
+
+    WORKERS = 3
+
+    @pytest.fixture
+    def crime_server(self, monkeypatch):
+        """The server module with a fresh response cache and a small worker pool."""
+        # Importing the server loads settings, which require an API key
+        monkeypatch.setenv("CRIME_API_KEY", os.getenv("CRIME_API_KEY", "test"))
+        from src.MCP_Servers.crime_mcp import server
+
+        monkeypatch.setattr(crime_functions, "_response_cache", {})
+        monkeypatch.setattr(server, "ROUTE_QUERY_WORKERS", self.WORKERS)
+        return server
+
+    def test_bounded_concurrency_and_input_order(self, crime_server, monkeypatch):
+        """At most ROUTE_QUERY_WORKERS requests are in flight; duplicates reuse their cell's answer."""
+        in_flight = {"now": 0, "peak": 0}
+        requested = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            lat = float(request.url.params["lat"])
+            requested.append(lat)
+            # Encode the queried latitude so scattered results can be traced
+            return httpx.Response(200, json=[{"total_incidents": round(lat * 100), "report_types": []}])
+
+        # Ten points ~1.1 km apart, then a repeat of each one
+        lats = [41.80 + i * 0.01 for i in range(10)]
+        points = [{"latitude": lat, "longitude": TEST_LON} for lat in lats + lats]
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                monkeypatch.setattr(crime_server, "http_client", client)
+                return await crime_server.get_route_crime_stats(points=points)
+
+        data = asyncio.run(run())
+
+        _record_test("route_stats_worker_pool", "pass", {
+            "peak_in_flight": in_flight["peak"],
+            "unique_queries": data["unique_queries"],
         })
-        pytest.fail(f"Server failed to start. stderr: {stderr[:500]}")
 
-    _record_test("server_start", "pass", {"pid": process.pid})
+        assert 1 < in_flight["peak"] <= self.WORKERS
+        assert sorted(requested) == lats
+        assert data["points_queried"] == 20
+        assert data["unique_queries"] == 10
+        assert [r["total_incidents"] for r in data["results"]] == [round(lat * 100) for lat in lats + lats]
+        assert [r["location"]["lat"] for r in data["results"]] == lats + lats
 
-    yield process
 
-    process.send_signal(signal.SIGTERM)
-    try:
-        process.wait(timeout=5)
-    except subprocess.TimeoutExpired:
-        process.kill()
+# =============================================================================
+# INTEGRATION TESTS (requires running server)
+# =============================================================================
 
+# The mcp_server / mcp_client fixtures live in conftest.py (session scope)
 
 class TestMCPServerIntegration:
     """Integration tests using fastmcp.Client to talk to the running server."""
 
-    @pytest.mark.asyncio
-    async def test_server_connects(self, mcp_server):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_server_connects(self, mcp_client):
         """Test that the fastmcp Client can connect to the server."""
-        client = Client(MCP_URL)
-        async with client:
-            connected = client.is_connected()
+        connected = mcp_client.is_connected()
 
-            _record_test("server_connects", "pass" if connected else "fail", {
-                "connected": connected,
-            })
+        _record_test("server_connects", "pass" if connected else "fail", {
+            "connected": connected,
+        })
 
-            assert connected
+        assert connected
 
-    @pytest.mark.asyncio
-    async def test_tool_listing(self, mcp_server):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_tool_listing(self, mcp_client):
         """Test that tools/list returns our two tools."""
-        client = Client(MCP_URL)
-        async with client:
-            tools = await client.list_tools()
-            tool_names = [t.name for t in tools]
-
-            has_stats = "get_location_crime_stats" in tool_names
-            has_incidents = "get_location_crime_incidents" in tool_names
-
-            _record_test("tool_listing", "pass" if (has_stats and has_incidents) else "fail", {
-                "tool_names": tool_names,
-                "tool_count": len(tool_names),
-                "has_stats": has_stats,
-                "has_incidents": has_incidents,
-            })
-
-            assert has_stats, f"Missing get_location_crime_stats. Found: {tool_names}"
-            assert has_incidents, f"Missing get_location_crime_incidents. Found: {tool_names}"
-
-    @pytest.mark.asyncio
-    async def test_crime_stats_tool(self, mcp_server):
-        """Test calling the get_location_crime_stats tool."""
-        client = Client(MCP_URL)
-        async with client:
-            result = await client.call_tool(
+        tools = await mcp_client.list_tools()
+        tool_names = [t.name for t in tools]
+
+        has_stats = "get_location_crime_stats" in tool_names
+        has_incidents = "get_location_crime_incidents" in tool_names
+        has_route_stats = "get_route_crime_stats" in tool_names
+
+        passed = has_stats and has_incidents and has_route_stats
+        _record_test("tool_listing", "pass" if passed else "fail", {
+            "tool_names": tool_names,
+            "tool_count": len(tool_names),
+            "has_stats": has_stats,
+            "has_incidents": has_incidents,
+            "has_route_stats": has_route_stats,
+        })
+
+        assert has_stats, f"Missing get_location_crime_stats. Found: {tool_names}"
+        assert has_incidents, f"Missing get_location_crime_incidents. Found: {tool_names}"
+        assert has_route_stats, f"Missing get_route_crime_stats. Found: {tool_names}"
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_route_crime_stats_dedupes_cells(self, mcp_client):
+        """Points in the same grid cell share one query; results keep input order."""
+        points = [
+            {"latitude": TEST_LAT, "longitude": TEST_LON},
+            {"latitude": 41.7000, "longitude": -87.7000},    # different cell
+            {"latitude": TEST_LAT + 0.0001, "longitude": TEST_LON},  # same cell as 0
+            {"latitude": TEST_LAT, "longitude": TEST_LON},   # duplicate of 0
+        ]
+
+        result = await mcp_client.call_tool(
+            "get_route_crime_stats",
+            {"points": points, "radius_miles": 0.5, "days_back": 30},
+        )
+        data = result.data
+
+        _record_test("route_crime_stats_tool", "pass", {
+            "points_queried": data["points_queried"],
+            "unique_queries": data["unique_queries"],
+        })
+
+        assert data["points_queried"] == 4
+        assert data["unique_queries"] == 2
+        assert [r["location"] for r in data["results"]] == [
+            {"lat": p["latitude"], "lon": p["longitude"]} for p in points
+        ]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_crime_tools_concurrent(self, mcp_client):
+        """Test calling the stats and incidents tools concurrently."""
+        stats_result, incidents_result = await asyncio.gather(
+            mcp_client.call_tool(
                 "get_location_crime_stats",
                 {
                     "latitude": TEST_LAT,
@@ -253,24 +483,8 @@ class TestMCPServerIntegration:
                     "radius_miles": 1.0,
                     "days_back": 180,
                 },
-            )
-
-            # Result is a list of content items; extract text
-            result_text = str(result)
-
-            _record_test("crime_stats_tool", "pass", {
-                "result": result_text[:1000],
-                "note": "Tool executed successfully (API may be rate limited)",
-            })
-
-            assert result is not None
-
-    @pytest.mark.asyncio
-    async def test_crime_incidents_tool(self, mcp_server):
-        """Test calling the get_location_crime_incidents tool."""
-        client = Client(MCP_URL)
-        async with client:
-            result = await client.call_tool(
+            ),
+            mcp_client.call_tool(
                 "get_location_crime_incidents",
                 {
                     "latitude": TEST_LAT,
@@ -279,26 +493,21 @@ class TestMCPServerIntegration:
                     "days_back": 180,
                     "limit": 10,
                 },
-            )
-
-            result_text = str(result)
-
-            _record_test("crime_incidents_tool", "pass", {
-                "result": result_text[:1000],
-                "note": "Tool executed successfully (API may be rate limited)",
-            })
+            ),
+        )
 
-            assert result is not None
-
-
-# =============================================================================
-# FINAL HOOK: save results when test session ends
-# =============================================================================
+        # Result is a list of content items; extract text
+        _record_test("crime_stats_tool", "pass", {
+            "result": str(stats_result)[:1000],
+            "note": "Tool executed successfully (API may be rate limited)",
+        })
+        _record_test("crime_incidents_tool", "pass", {
+            "result": str(incidents_result)[:1000],
+            "note": "Tool executed successfully (API may be rate limited)",
+        })
 
-def pytest_sessionfinish(session, exitstatus):
-    """Save final results after all tests complete."""
-    _save_results()
-    print(f"\nPhase 1 test results saved to: {RESULTS_FILE}")
+        assert stats_result is not None
+        assert incidents_result is not None
 
 
 if __name__ == "__main__":
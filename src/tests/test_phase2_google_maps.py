@@ -4,21 +4,31 @@ Test Strategy:
 - MOCKED tests: Test helper functions without API calls (always run)
 - LIVE tests: Test actual Google Maps API integration (require API key)
 
-Run mocked tests only:
-    pytest src/tests/test_phase2_google_maps.py -v -m "not live"
-
-Run all tests (requires GOOGLE_MAPS_API_KEY):
+Run mocked tests only (default, parallel via pytest.ini):
     pytest src/tests/test_phase2_google_maps.py -v
 
+Run live tests (requires GOOGLE_MAPS_API_KEY):
+    pytest src/tests/test_phase2_google_maps.py -v -m live -n 0
+
 Run with verbose output:
-    pytest src/tests/test_phase2_google_maps.py -v -s
+    pytest src/tests/test_phase2_google_maps.py -v -s -n 0
 """
+import asyncio
 import pytest
 import os
+import time
+from types import SimpleNamespace
+
+import httpx
 
 # Import the module under test
+from src.helper_functions import google_maps
 from src.helper_functions.google_maps import (
     use_google_maps,
+    use_google_maps_async,
+    use_google_maps_many,
+    use_google_maps_stream,
+    enrich_waypoints_with_locations,
     sample_points_from_polyline,
     haversine_distance,
     get_adaptive_interval,
@@ -44,6 +54,107 @@ skip_if_no_api_key = pytest.mark.skipif(
 )
 
 
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+# Sample polyline from Chicago area (distinct start and end)
+TEST_POLYLINE = "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+
+
+# Sampled once at import so parametrized tests get one case per waypoint
+WAYPOINTS_HALF_MILE = sample_points_from_polyline(TEST_POLYLINE, interval_miles=0.5)
+WAYPOINTS_ONE_MILE = sample_points_from_polyline(TEST_POLYLINE, interval_miles=1.0)
+
+
+def _fake_route(route_id: int) -> RouteData:
+    """A minimal RouteData for mocked tests (no API call); each route id sits 0.1 deg further north."""
+    offset = (route_id - 1) * 0.1
+    return RouteData(
+        route_id=route_id,
+        summary=f"Route {route_id}",
+        distance_miles=2.0,
+        duration_minutes=10,
+        start_address="Willis Tower, Chicago, IL",
+        end_address="Navy Pier, Chicago, IL",
+        waypoints=[
+            RoutePoint(41.8789 + offset, -87.6359),
+            RoutePoint(41.8917 + offset, -87.6086),
+        ],
+        polyline=TEST_POLYLINE,
+    )
+
+
+@pytest.fixture
+def stub_directions(monkeypatch):
+    """Fake API key and Directions lookup returning two routes; yields the call log."""
+    calls = []
+
+    def fake_get_routes(start, destination, include_traffic, sample_waypoints):
+        calls.append((start, destination))
+        return [_fake_route(1), _fake_route(2)]
+
+    monkeypatch.setattr(google_maps, "GOOGLE_API_KEY", "test-key")
+    monkeypatch.setattr(google_maps, "_get_routes", fake_get_routes)
+    return calls
+
+
+class _FakeMatrixClient:
+    """Stands in for googlemaps.Client.distance_matrix; unknown pairs are NOT_FOUND."""
+
+    def __init__(self, durations):
+        self.durations = durations
+        self.calls = []
+
+    def distance_matrix(self, origins, destinations, mode, departure_time=None):
+        self.calls.append((list(origins), list(destinations)))
+        rows = []
+        for origin in origins:
+            elements = []
+            for destination in destinations:
+                seconds = self.durations.get((origin, destination))
+                if seconds is None:
+                    elements.append({"status": "NOT_FOUND"})
+                else:
+                    elements.append({"status": "OK", "duration": {"value": seconds}})
+            rows.append({"elements": elements})
+        return {"rows": rows}
+
+
+@pytest.fixture
+def fake_matrix(monkeypatch, stub_directions):
+    """Install a fake Distance Matrix client; set .durations before calling."""
+    client = _FakeMatrixClient({})
+    monkeypatch.setattr(google_maps, "_client", lambda: client)
+    return client
+
+
+@pytest.fixture(scope="module")
+def waypoints_huge_interval():
+    """TEST_POLYLINE sampled with an interval longer than the route."""
+    return sample_points_from_polyline(TEST_POLYLINE, interval_miles=100.0)
+
+
+@pytest.fixture(scope="session")
+def routes_willis_navy(google_routes):
+    """Live Willis Tower -> Navy Pier routes (~2 mi), fetched once per session."""
+    return google_routes(
+        start="Willis Tower, Chicago, IL",
+        destination="Navy Pier, Chicago, IL",
+        include_places=False
+    )
+
+
+@pytest.fixture(scope="session")
+def routes_willis_ohare(google_routes):
+    """Live Willis Tower -> O'Hare routes (~16 mi), fetched once per session."""
+    return google_routes(
+        start="Willis Tower, Chicago, IL",
+        destination="O'Hare International Airport, Chicago, IL",
+        include_places=False
+    )
+
+
 # =============================================================================
 # MOCKED TESTS - No API calls required
 # =============================================================================
@@ -151,6 +262,46 @@ class TestClassifyTraffic:
         assert traffic.traffic_delay_minutes == 0
 
 
+class TestPolylineDecoders:
+    """Test the native (pypolyline) and NumPy polyline decoders agree."""
+
+    @staticmethod
+    def _long_polyline():
+        import polyline
+        return polyline.encode([(41.8 + i * 0.001, -87.6 - i * 0.0007) for i in range(500)])
+
+    def test_numpy_decoder_matches_reference(self):
+        """The NumPy decoder matches the reference `polyline` package."""
+        import numpy as np
+        import polyline
+
+        for encoded in (TEST_POLYLINE, self._long_polyline()):
+            np.testing.assert_allclose(
+                google_maps._decode_polyline_numpy(encoded), polyline.decode(encoded)
+            )
+
+    def test_native_decoder_matches_numpy(self):
+        """pypolyline's [lon, lat] output is swapped to (lat, lon) like the NumPy path."""
+        pytest.importorskip("pypolyline.cutil")
+        import numpy as np
+
+        assert google_maps._native_decode_polyline is not None
+        for encoded in (TEST_POLYLINE, self._long_polyline()):
+            np.testing.assert_allclose(
+                google_maps.decode_polyline(encoded),
+                google_maps._decode_polyline_numpy(encoded)
+            )
+
+    def test_native_rejection_falls_back(self):
+        """Coordinates pypolyline rejects (RuntimeError) are decoded by NumPy."""
+        pytest.importorskip("pypolyline.cutil")
+
+        # (95, 190), (96, 191): out of range, so pypolyline refuses it
+        assert google_maps.decode_polyline("_uybQ_ktfc@_ibE_ibE").tolist() == [
+            [95.0, 190.0], [96.0, 191.0]
+        ]
+
+
 class TestSamplePointsFromPolyline:
     """Test polyline sampling."""
 
@@ -170,34 +321,21 @@ class TestSamplePointsFromPolyline:
         assert len(waypoints) >= 1
         assert isinstance(waypoints[0], RoutePoint)
 
-    def test_waypoints_are_route_points(self):
-        """All returned waypoints should be RoutePoint instances."""
-        # Sample polyline from Chicago area
-        test_polyline = "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
-
-        waypoints = sample_points_from_polyline(test_polyline, interval_miles=1.0)
-
-        assert all(isinstance(wp, RoutePoint) for wp in waypoints)
-
-    def test_waypoints_have_valid_coordinates(self):
-        """Waypoints should have valid GPS coordinates."""
-        test_polyline = "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
-
-        waypoints = sample_points_from_polyline(test_polyline, interval_miles=0.5)
+    @pytest.mark.parametrize("wp", WAYPOINTS_ONE_MILE)
+    def test_waypoint_is_route_point(self, wp):
+        """Every returned waypoint should be a RoutePoint instance."""
+        assert isinstance(wp, RoutePoint)
 
-        for wp in waypoints:
-            assert -90 <= wp.latitude <= 90
-            assert -180 <= wp.longitude <= 180
+    @pytest.mark.parametrize("wp", WAYPOINTS_HALF_MILE)
+    def test_waypoint_has_valid_coordinates(self, wp):
+        """Every waypoint should have valid GPS coordinates."""
+        assert -90 <= wp.latitude <= 90
+        assert -180 <= wp.longitude <= 180
 
-    def test_start_and_end_included(self):
+    def test_start_and_end_included(self, waypoints_huge_interval):
         """First and last points should always be included."""
-        # This polyline has distinct start and end
-        test_polyline = "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
-
-        waypoints = sample_points_from_polyline(test_polyline, interval_miles=100.0)
-
         # With a huge interval, we should still get at least start and end
-        assert len(waypoints) >= 2
+        assert len(waypoints_huge_interval) >= 2
 
 
 class TestDataClasses:
@@ -272,6 +410,455 @@ class TestDataClasses:
         assert len(data["places_along_route"]) == 1
 
 
+class TestAsyncEntryPoints:
+    """Test the async API and the sync wrapper around it (Directions stubbed)."""
+
+    def test_async_variant_returns_routes(self, stub_directions):
+        """use_google_maps_async should be awaitable from a running loop."""
+        routes = asyncio.run(use_google_maps_async("a", "b", include_places=False))
+
+        assert [r.route_id for r in routes] == [1, 2]
+        assert stub_directions == [("a", "b")]
+
+    def test_sync_wrapper_inside_running_loop(self, stub_directions):
+        """use_google_maps should not fail when an event loop is already running."""
+        async def caller():
+            return use_google_maps("a", "b", include_places=False)
+
+        routes = asyncio.run(caller())
+
+        assert [r.route_id for r in routes] == [1, 2]
+
+    def test_sync_wrapper_without_loop(self, stub_directions):
+        """use_google_maps should work from plain sync code."""
+        routes = use_google_maps("a", "b", include_places=False)
+
+        assert len(routes) == 2
+
+    @pytest.fixture
+    def sample_flags(self, monkeypatch, stub_directions):
+        """Record the sample_waypoints flag passed to _get_routes; no waypoints unless sampled."""
+        flags = []
+
+        def fake_get_routes(start, destination, include_traffic, sample_waypoints):
+            flags.append(sample_waypoints)
+            routes = [_fake_route(1), _fake_route(2)]
+            if not sample_waypoints:
+                for route in routes:
+                    route.waypoints = []
+            return routes
+
+        monkeypatch.setattr(google_maps, "_get_routes", fake_get_routes)
+        return flags
+
+    def test_no_waypoints_or_places_skips_sampling(self, sample_flags):
+        """return_waypoints=False without places never samples the polyline."""
+        routes = use_google_maps("a", "b", include_places=False, return_waypoints=False)
+
+        assert sample_flags == [False]
+        assert all(r.waypoints == [] for r in routes)
+
+    def test_places_without_returned_waypoints(self, sample_flags, monkeypatch):
+        """Places still need sampled waypoints, which are dropped from the result afterwards."""
+        async def fake_places_nearby(client, semaphore, point, place_type, radius, max_places):
+            return [PlaceInfo("Station", place_type, point.latitude, point.longitude)]
+
+        monkeypatch.setattr(google_maps, "_places_cache", google_maps.OrderedDict())
+        monkeypatch.setattr(google_maps, "_places_nearby", fake_places_nearby)
+
+        routes = use_google_maps("a", "b", include_places=True, return_waypoints=False,
+                                 place_types=["police"])
+
+        assert sample_flags == [True]
+        assert all(r.waypoints == [] for r in routes)
+        assert all(len(r.places_along_route) == 2 for r in routes)
+
+    def test_enrich_inside_running_loop(self, stub_directions, monkeypatch):
+        """enrich_waypoints_with_locations should work under a running loop."""
+        # Pre-filled cache cell, so no geocoding request is made
+        monkeypatch.setattr(google_maps, "_geocode_cache", google_maps.OrderedDict({
+            (41.8789, -87.6359): ("The Loop", "urban"),
+            (41.8917, -87.6086): ("Streeterville", "urban"),
+        }))
+        route = _fake_route(1)
+
+        async def caller():
+            return enrich_waypoints_with_locations([route])
+
+        asyncio.run(caller())
+
+        assert [wp.description for wp in route.waypoints] == ["The Loop", "Streeterville"]
+        assert route.waypoints[0].area_type == "urban"
+
+    def test_enrich_gmaps_client_is_deprecated(self, stub_directions, monkeypatch):
+        """Passing gmaps_client warns, but its key is used when the env has none."""
+        keys = []
+
+        async def fake_reverse_geocode(client, semaphore, latitude, longitude, api_key):
+            keys.append(api_key)
+            return "The Loop", "urban"
+
+        monkeypatch.setattr(google_maps, "GOOGLE_API_KEY", None)
+        monkeypatch.setattr(google_maps, "_geocode_cache", google_maps.OrderedDict())
+        monkeypatch.setattr(google_maps, "_reverse_geocode", fake_reverse_geocode)
+        route = _fake_route(1)
+
+        with pytest.warns(DeprecationWarning):
+            enrich_waypoints_with_locations([route], gmaps_client=SimpleNamespace(key="client-key"))
+
+        assert keys == ["client-key", "client-key"]
+        assert route.waypoints[0].description == "The Loop"
+
+    @pytest.mark.parametrize("status", ["OVER_QUERY_LIMIT", "REQUEST_DENIED"])
+    def test_reverse_geocode_error_status_is_not_cached(self, monkeypatch, status):
+        """An HTTP 200 carrying an error status is a failed lookup, so it is retried later."""
+        def handler(request):
+            return httpx.Response(200, json={"status": status, "results": []})
+
+        async def lookup():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await google_maps._reverse_geocode(
+                    client, asyncio.Semaphore(1), 41.0, -87.0, "test-key"
+                )
+
+        assert asyncio.run(lookup()) is None
+
+        real_async_client = httpx.AsyncClient
+        monkeypatch.setattr(google_maps, "_geocode_cache", google_maps.OrderedDict())
+        monkeypatch.setattr(
+            google_maps.httpx, "AsyncClient",
+            lambda **kwargs: real_async_client(transport=httpx.MockTransport(handler))
+        )
+        route = _fake_route(1)
+        asyncio.run(google_maps._enrich_waypoints([route], "test-key"))
+
+        assert google_maps._geocode_cache == {}
+        assert route.waypoints[0].description is None
+
+
+class TestRateLimiting:
+    """Test the client-side token bucket and its wiring."""
+
+    def test_bucket_allows_burst_then_waits(self):
+        """Up to `rate` tokens are free; the next one reports a wait of at most 1/rate."""
+        limiter = google_maps._RateLimiter(5)
+
+        delays = [limiter._take() for _ in range(5)]
+        next_delay = limiter._take()
+
+        assert delays == [0.0] * 5
+        assert 0 < next_delay <= 1 / 5
+
+    def test_bucket_below_one_per_second_refills(self, monkeypatch):
+        """A rate under 1/s still holds one token, so calls are spaced rather than starved."""
+        clock = [100.0]
+        monkeypatch.setattr(google_maps.time, "monotonic", lambda: clock[0])
+        limiter = google_maps._RateLimiter(0.5)
+
+        first = limiter._take()
+        second = limiter._take()
+        clock[0] += 2.0
+        after_refill = limiter._take()
+
+        assert first == 0.0
+        assert second == pytest.approx(2.0)
+        assert after_refill == 0.0
+
+    def test_sync_and_async_entry_take_tokens(self):
+        """Both `with` and `async with` consume a token."""
+        limiter = google_maps._RateLimiter(2)
+
+        with limiter:
+            pass
+
+        async def enter():
+            async with limiter:
+                pass
+
+        asyncio.run(enter())
+
+        assert limiter._take() > 0  # bucket of 2 is now empty
+
+    def test_set_rate(self, monkeypatch):
+        """set_rate replaces one API's limiter and rejects bad input."""
+        monkeypatch.setattr(google_maps, "_rate_limiters", dict(google_maps._rate_limiters))
+
+        google_maps.set_rate("directions", 5)
+
+        assert google_maps._rate_limiters["directions"].rate == 5
+        with pytest.raises(ValueError):
+            google_maps.set_rate("unknown_api", 5)
+        with pytest.raises(ValueError):
+            google_maps.set_rate("places", 0)
+
+    def test_directions_request_is_throttled(self, monkeypatch):
+        """_request_directions goes through the "directions" limiter."""
+        entered = []
+
+        class CountingLimiter:
+            def __enter__(self):
+                entered.append(1)
+
+            def __exit__(self, *exc_info):
+                return None
+
+        def handler(request):
+            return httpx.Response(200, json={"status": "ZERO_RESULTS"})
+
+        monkeypatch.setattr(google_maps, "USE_GMAPS_SDK", False)
+        monkeypatch.setattr(google_maps, "_rate_limiters", {
+            **google_maps._rate_limiters, "directions": CountingLimiter()
+        })
+        monkeypatch.setattr(
+            google_maps, "_http_client",
+            lambda: httpx.Client(transport=httpx.MockTransport(handler))
+        )
+
+        assert google_maps._request_directions({"origin": "a", "destination": "b"}) == []
+        assert entered == [1]
+
+
+class TestDirectionsCache:
+    """Test the opt-in on-disk Directions cache (Directions API stubbed)."""
+
+    @pytest.fixture
+    def directions_calls(self, monkeypatch, tmp_path):
+        """Cache enabled in tmp_path; returns the list of Directions requests made."""
+        calls = []
+
+        def fake_request_directions(params):
+            calls.append(params)
+            return [{
+                "summary": "I-90",
+                "overview_polyline": {"points": TEST_POLYLINE},
+                "legs": [{
+                    "distance": {"value": 3200},
+                    "duration": {"value": 600},
+                    "start_address": "A",
+                    "end_address": "B",
+                }],
+            }]
+
+        monkeypatch.setattr(google_maps, "DIRECTIONS_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(google_maps, "_request_directions", fake_request_directions)
+        return calls
+
+    @staticmethod
+    def _routes(include_traffic=False):
+        return google_maps._get_routes("A", "B", include_traffic=include_traffic,
+                                       sample_waypoints=False)
+
+    def test_hit(self, directions_calls, tmp_path):
+        """A repeat request within the TTL is served from disk."""
+        first = self._routes()
+        second = self._routes()
+
+        assert len(directions_calls) == 1
+        assert len(list(tmp_path.glob("directions-*.json"))) == 1
+        assert second[0].summary == first[0].summary == "I-90"
+
+    def test_expired_entry_is_refetched(self, directions_calls, tmp_path):
+        """Entries older than the TTL are ignored."""
+        self._routes()
+        old = time.time() - google_maps.DIRECTIONS_CACHE_TTL_SECONDS - 60
+        for cached in tmp_path.glob("directions-*.json"):
+            os.utime(cached, (old, old))
+
+        self._routes()
+
+        assert len(directions_calls) == 2
+
+    def test_disabled_by_default(self, directions_calls, monkeypatch, tmp_path):
+        """With no cache directory configured nothing is read or written."""
+        monkeypatch.setattr(google_maps, "DIRECTIONS_CACHE_DIR", "")
+
+        self._routes()
+        self._routes()
+
+        assert len(directions_calls) == 2
+        assert list(tmp_path.iterdir()) == []
+
+    def test_traffic_requests_bypass_cache(self, directions_calls, tmp_path):
+        """Live traffic is never served from (or written to) the cache."""
+        self._routes(include_traffic=True)
+        self._routes(include_traffic=True)
+
+        assert len(directions_calls) == 2
+        assert list(tmp_path.iterdir()) == []
+
+    def test_prune_survives_vanished_file(self, directions_calls, tmp_path):
+        """A cache file disappearing mid-prune doesn't abort the save."""
+        # A dangling symlink fails stat() just like a concurrently deleted file
+        (tmp_path / "directions-vanished.json").symlink_to(tmp_path / "missing")
+
+        self._routes()
+        self._routes()
+
+        assert len(directions_calls) == 1
+
+
+class TestInProcessCaches:
+    """Test the Places and reverse-geocode LRU caches when they are full."""
+
+    @staticmethod
+    def _route(route_id: int, latitude: float) -> RouteData:
+        route = _fake_route(route_id)
+        route.waypoints = [RoutePoint(latitude, -87.6359)]
+        return route
+
+    def test_places_hits_survive_own_evictions(self, monkeypatch):
+        """A hit is not lost when this call's new results evict older entries."""
+        searched = []
+
+        async def fake_places_nearby(client, semaphore, point, place_type, radius, max_places):
+            searched.append(point.latitude)
+            return [PlaceInfo(f"near {point.latitude}", place_type,
+                              point.latitude, point.longitude)]
+
+        monkeypatch.setattr(google_maps, "PLACES_CACHE_MAX_ENTRIES", 2)
+        monkeypatch.setattr(google_maps, "_places_cache", google_maps.OrderedDict())
+        monkeypatch.setattr(google_maps, "_places_nearby", fake_places_nearby)
+
+        def places_for(*latitudes):
+            routes = [self._route(i + 1, lat) for i, lat in enumerate(latitudes)]
+            return asyncio.run(google_maps._get_places_along_routes(routes, ["police"]))
+
+        places_for(41.1)
+        places_for(41.2)
+        result = places_for(41.1, 41.3)
+
+        assert searched == [41.1, 41.2, 41.3]
+        assert [p.name for p in result[0]] == ["near 41.1"]
+        assert [p.name for p in result[1]] == ["near 41.3"]
+
+    def test_geocode_hits_survive_own_evictions(self, monkeypatch):
+        """With a full cache, a cached cell keeps its description after new lookups."""
+        looked_up = []
+
+        async def fake_reverse_geocode(client, semaphore, latitude, longitude, api_key):
+            looked_up.append(latitude)
+            return f"Area {latitude}", None
+
+        monkeypatch.setattr(google_maps, "GEOCODE_CACHE_MAX_ENTRIES", 1)
+        monkeypatch.setattr(google_maps, "_geocode_cache", google_maps.OrderedDict({
+            (41.1, -87.6359): ("The Loop", "urban"),
+        }))
+        monkeypatch.setattr(google_maps, "_reverse_geocode", fake_reverse_geocode)
+        routes = [self._route(1, 41.1), self._route(2, 41.2)]
+
+        asyncio.run(google_maps._enrich_waypoints(routes, "test-key"))
+
+        assert looked_up == [41.2]
+        assert routes[0].waypoints[0].description == "The Loop"
+        assert routes[1].waypoints[0].description == "Area 41.2"
+        assert list(google_maps._geocode_cache) == [(41.2, -87.6359)]
+
+
+class TestUseGoogleMapsStream:
+    """Test use_google_maps_stream (Directions and Places stubbed)."""
+
+    @pytest.fixture
+    def fake_places(self, monkeypatch, stub_directions):
+        """Fake Places search; route 1 is slow. Records clients, semaphores, cancellations."""
+        log = {"clients": set(), "semaphores": set(), "cancelled": 0, "route1_delay": 0.05}
+
+        async def fake_places_nearby(client, semaphore, point, place_type, radius, max_places):
+            log["clients"].add(id(client))
+            log["semaphores"].add(id(semaphore))
+            try:
+                if point.latitude < 41.95:  # route 1
+                    await asyncio.sleep(log["route1_delay"])
+            except asyncio.CancelledError:
+                log["cancelled"] += 1
+                raise
+            return [PlaceInfo(f"{place_type} near {point.latitude:.4f}", place_type,
+                              point.latitude, point.longitude)]
+
+        monkeypatch.setattr(google_maps, "_places_cache", google_maps.OrderedDict())
+        monkeypatch.setattr(google_maps, "_places_nearby", fake_places_nearby)
+        return log
+
+    def test_yields_in_completion_order_with_places(self, fake_places):
+        """Faster routes come first and every route gets its places attached."""
+        async def collect():
+            return [r async for r in use_google_maps_stream("a", "b", place_types=["police"])]
+
+        routes = asyncio.run(collect())
+
+        assert [r.route_id for r in routes] == [2, 1]
+        assert all(len(r.places_along_route) == 2 for r in routes)
+        assert all(p.place_type == "police" for r in routes for p in r.places_along_route)
+        # One client and one concurrency limit for the whole request
+        assert len(fake_places["clients"]) == 1
+        assert len(fake_places["semaphores"]) == 1
+
+    def test_stopping_early_cancels_pending_searches(self, fake_places):
+        """Closing the stream after the first route cancels the slower searches."""
+        fake_places["route1_delay"] = 10
+
+        async def first_only():
+            stream = use_google_maps_stream("a", "b", place_types=["police"])
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first
+
+        first = asyncio.run(first_only())
+
+        assert first.route_id == 2
+        assert fake_places["cancelled"] == 2
+
+
+class TestUseGoogleMapsMany:
+    """Test pair ranking for use_google_maps_many (Distance Matrix and Directions stubbed)."""
+
+    PAIRS = [("A", "X"), ("B", "Y"), ("C", "Z")]
+
+    def test_no_ranking_without_top_k(self, fake_matrix, stub_directions):
+        """Without top_k every pair is fetched, so Distance Matrix is not called."""
+        result = use_google_maps_many(self.PAIRS, include_places=False)
+
+        assert fake_matrix.calls == []
+        assert list(result) == self.PAIRS
+        assert sorted(stub_directions) == sorted(self.PAIRS)
+
+    def test_no_ranking_when_top_k_covers_all(self, fake_matrix, stub_directions):
+        """top_k >= len(pairs) keeps everything, so ranking is skipped."""
+        result = use_google_maps_many(self.PAIRS, top_k=5, include_places=False)
+
+        assert fake_matrix.calls == []
+        assert len(result) == 3
+
+    def test_top_k_fetches_fastest(self, fake_matrix, stub_directions):
+        """Only the top_k fastest pairs are fetched, fastest first."""
+        fake_matrix.durations = {("A", "X"): 900, ("B", "Y"): 300, ("C", "Z"): 600}
+
+        result = use_google_maps_many(self.PAIRS, top_k=2, include_places=False)
+
+        assert list(result) == [("B", "Y"), ("C", "Z")]
+        assert sorted(stub_directions) == [("B", "Y"), ("C", "Z")]
+
+    def test_one_element_per_pair(self, fake_matrix, stub_directions):
+        """Requests go one origin at a time, chunked by the destination limit."""
+        limit = google_maps.DISTANCE_MATRIX_MAX_DESTINATIONS
+        pairs = [("A", f"D{i}") for i in range(limit + 5)] + [("B", "D0"), ("B", "D0")]
+        fake_matrix.durations = {pair: i for i, pair in enumerate(pairs)}
+
+        use_google_maps_many(pairs, top_k=1, include_places=False)
+
+        assert [(o, len(d)) for o, d in fake_matrix.calls] == [
+            (["A"], limit), (["A"], 5), (["B"], 1)
+        ]
+
+    def test_unroutable_pair_raises(self, fake_matrix, stub_directions):
+        """A pair Google can't route is reported instead of silently dropped."""
+        fake_matrix.durations = {("A", "X"): 900, ("C", "Z"): 600}
+
+        with pytest.raises(ValueError, match="'B' -> 'Y'"):
+            use_google_maps_many(self.PAIRS, top_k=1, include_places=False)
+
+        assert stub_directions == []
+
+
 # =============================================================================
 # LIVE TESTS - Require Google Maps API key
 # =============================================================================
@@ -281,21 +868,17 @@ class TestDataClasses:
 class TestUseGoogleMapsLive:
     """Live integration tests for Google Maps API."""
 
-    def test_returns_list_of_routes(self):
+    def test_returns_list_of_routes(self, routes_willis_navy):
         """use_google_maps should return a list of RouteData."""
-        routes = use_google_maps(
-            start="Willis Tower, Chicago, IL",
-            destination="Navy Pier, Chicago, IL",
-            include_places=False  # Skip places for faster test
-        )
+        routes = routes_willis_navy
 
         assert isinstance(routes, list)
         assert len(routes) >= 1
         assert all(isinstance(r, RouteData) for r in routes)
 
-    def test_route_has_required_fields(self):
+    def test_route_has_required_fields(self, google_routes):
         """Each route should have all required fields populated."""
-        routes = use_google_maps(
+        routes = google_routes(
             start="Millennium Park, Chicago, IL",
             destination="Lincoln Park Zoo, Chicago, IL",
             include_places=False
@@ -312,9 +895,9 @@ class TestUseGoogleMapsLive:
         assert len(route.waypoints) >= 2  # At least start and end
         assert route.polyline  # Non-empty polyline
 
-    def test_waypoints_have_valid_coordinates(self):
+    def test_waypoints_have_valid_coordinates(self, google_routes):
         """All waypoints should have valid GPS coordinates."""
-        routes = use_google_maps(
+        routes = google_routes(
             start="Union Station, Chicago, IL",
             destination="Wrigley Field, Chicago, IL",
             include_places=False
@@ -326,9 +909,9 @@ class TestUseGoogleMapsLive:
                 assert -90 <= waypoint.latitude <= 90
                 assert -180 <= waypoint.longitude <= 180
 
-    def test_traffic_data_included(self):
+    def test_traffic_data_included(self, google_routes):
         """Routes should include traffic data when requested."""
-        routes = use_google_maps(
+        routes = google_routes(
             start="Downtown Chicago, IL",
             destination="Evanston, IL",
             include_traffic=True,
@@ -345,9 +928,9 @@ class TestUseGoogleMapsLive:
         assert traffic.duration_in_traffic_minutes >= 0
         assert traffic.traffic_condition in ["light", "moderate", "heavy"]
 
-    def test_places_along_route(self):
+    def test_places_along_route(self, google_routes):
         """Places should be found when requested."""
-        routes = use_google_maps(
+        routes = google_routes(
             start="Willis Tower, Chicago, IL",
             destination="Navy Pier, Chicago, IL",
             include_traffic=False,
@@ -364,13 +947,9 @@ class TestUseGoogleMapsLive:
             assert place.name
             assert place.place_type == "gas_station"
 
-    def test_multiple_alternatives(self):
+    def test_multiple_alternatives(self, routes_willis_ohare):
         """Should return multiple route alternatives when available."""
-        routes = use_google_maps(
-            start="Willis Tower, Chicago, IL",
-            destination="O'Hare International Airport, Chicago, IL",
-            include_places=False
-        )
+        routes = routes_willis_ohare
 
         # O'Hare route typically has 2-3 alternatives
         assert len(routes) >= 1
@@ -379,29 +958,17 @@ class TestUseGoogleMapsLive:
         route_ids = [r.route_id for r in routes]
         assert len(route_ids) == len(set(route_ids))
 
-    def test_adaptive_sampling_short_route(self):
+    def test_adaptive_sampling_short_route(self, routes_willis_navy):
         """Short urban routes should have dense waypoint sampling."""
-        routes = use_google_maps(
-            start="Willis Tower, Chicago, IL",
-            destination="Navy Pier, Chicago, IL",  # ~2 miles
-            include_places=False
-        )
-
-        route = routes[0]
+        route = routes_willis_navy[0]
 
         # ~2 mile route with 0.5 mile intervals should have 4-6 waypoints
         assert len(route.waypoints) >= 3
         assert len(route.waypoints) <= 10
 
-    def test_adaptive_sampling_longer_route(self):
+    def test_adaptive_sampling_longer_route(self, routes_willis_ohare):
         """Longer routes should have sparser waypoint sampling."""
-        routes = use_google_maps(
-            start="Willis Tower, Chicago, IL",
-            destination="O'Hare International Airport, Chicago, IL",  # ~16 miles
-            include_places=False
-        )
-
-        route = routes[0]
+        route = routes_willis_ohare[0]
 
         # ~16 mile route with 1.5 mile intervals should have ~12 waypoints
         assert len(route.waypoints) >= 5